@@ -0,0 +1,219 @@
+import numpy as np
+
+
+class AdaptiveStrategy(object):
+    """
+    Base class for adaptive sampling strategies along a single input parameter. The strategy starts with n_initial
+    equally spaced points and afterwards proposes new points based on the output of the finished jobs. It is used by
+    SciSweeper.run_adaptive() which asks the strategy for new points whenever a core becomes available.
+
+    Args:
+        parameter (str): name of the input parameter which is sampled
+        lower (float): lower bound of the parameter
+        upper (float): upper bound of the parameter
+        output_key (str): name of the output which is evaluated
+        input_dict (dict/ None): input parameters which are the same for all jobs
+        n_initial (int): number of equally spaced points of the initial batch
+    """
+
+    def __init__(
+        self, parameter, lower, upper, output_key, input_dict=None, n_initial=5
+    ):
+        self._parameter = parameter
+        self._lower = lower
+        self._upper = upper
+        self._output_key = output_key
+        if input_dict is None:
+            input_dict = {}
+        self._input_dict = input_dict
+        self._n_initial = n_initial
+
+    def ask(self, n, result_lst, pending_lst):
+        """
+        Propose new input dictionaries.
+
+        Args:
+            n (int): maximum number of input dictionaries - the number of idle cores
+            result_lst (list): list of (input_dict, output_dict) tuples of the finished jobs
+            pending_lst (list): list of input dictionaries of the running jobs
+
+        Returns:
+            list: list of input dictionaries, an empty list when no new point is required
+        """
+        if len(result_lst) == 0 and len(pending_lst) == 0:
+            return [
+                self._get_input_dict(value=v)
+                for v in np.linspace(self._lower, self._upper, self._n_initial)
+            ]
+        finished_lst = sorted(
+            [
+                (input_dict[self._parameter], output_dict[self._output_key])
+                for input_dict, output_dict in result_lst
+                if self._output_key in output_dict.keys()
+            ],
+            key=lambda x: x[0],
+        )
+        pending_value_lst = sorted(
+            [input_dict[self._parameter] for input_dict in pending_lst]
+        )
+        return [
+            self._get_input_dict(value=v)
+            for v in self._get_next_values(
+                n=n, finished_lst=finished_lst, pending_value_lst=pending_value_lst
+            )
+        ]
+
+    def _get_next_values(self, n, finished_lst, pending_value_lst):
+        """
+        Propose new parameter values - has to be implemented by the strategy.
+
+        Args:
+            n (int): maximum number of parameter values
+            finished_lst (list): sorted list of (parameter value, output) tuples of the finished jobs
+            pending_value_lst (list): sorted list of parameter values of the running jobs
+
+        Returns:
+            list: list of parameter values
+        """
+        raise NotImplementedError
+
+    def _get_input_dict(self, value):
+        input_dict = self._input_dict.copy()
+        input_dict[self._parameter] = float(value)
+        return input_dict
+
+
+class BisectionStrategy(AdaptiveStrategy):
+    """
+    Locate the parameter value at which the output crosses a threshold. The interval which brackets the crossing is
+    divided by all idle cores at the same time, until it is smaller than the tolerance.
+
+    Args:
+        parameter (str): name of the input parameter which is sampled
+        lower (float): lower bound of the parameter
+        upper (float): upper bound of the parameter
+        output_key (str): name of the output which is evaluated
+        threshold (float): output value to locate
+        tolerance (float): width of the bracketing interval at which the search stops
+        input_dict (dict/ None): input parameters which are the same for all jobs
+        n_initial (int): number of equally spaced points of the initial batch
+    """
+
+    def __init__(
+        self,
+        parameter,
+        lower,
+        upper,
+        output_key,
+        threshold,
+        tolerance,
+        input_dict=None,
+        n_initial=5,
+    ):
+        super(BisectionStrategy, self).__init__(
+            parameter=parameter,
+            lower=lower,
+            upper=upper,
+            output_key=output_key,
+            input_dict=input_dict,
+            n_initial=n_initial,
+        )
+        self._threshold = threshold
+        self._tolerance = tolerance
+
+    def get_bracket(self, result_lst):
+        """
+        Get the interval which brackets the threshold crossing.
+
+        Args:
+            result_lst (list): list of (input_dict, output_dict) tuples of the finished jobs
+
+        Returns:
+            tuple/ None: (lower, upper) bound of the interval or None if no crossing was found
+        """
+        finished_lst = sorted(
+            [
+                (input_dict[self._parameter], output_dict[self._output_key])
+                for input_dict, output_dict in result_lst
+                if self._output_key in output_dict.keys()
+            ],
+            key=lambda x: x[0],
+        )
+        return self._get_bracket(finished_lst=finished_lst)
+
+    def _get_bracket(self, finished_lst):
+        for (x_1, y_1), (x_2, y_2) in zip(finished_lst[:-1], finished_lst[1:]):
+            if (y_1 >= self._threshold) != (y_2 >= self._threshold):
+                return x_1, x_2
+        return None
+
+    def _get_next_values(self, n, finished_lst, pending_value_lst):
+        bracket = self._get_bracket(finished_lst=finished_lst)
+        if bracket is None or bracket[1] - bracket[0] <= self._tolerance:
+            return []
+        point_lst = (
+            [bracket[0]]
+            + [v for v in pending_value_lst if bracket[0] < v < bracket[1]]
+            + [bracket[1]]
+        )
+        value_lst = []
+        for _ in range(n):
+            width_lst = np.diff(point_lst)
+            i = int(np.argmax(width_lst))
+            if width_lst[i] <= self._tolerance:
+                break
+            value = (point_lst[i] + point_lst[i + 1]) / 2
+            point_lst.insert(i + 1, value)
+            value_lst.append(value)
+        return value_lst
+
+
+class RefinementStrategy(AdaptiveStrategy):
+    """
+    Refine the sampling where the output changes fastest - new points are placed in the middle of the intervals with
+    the largest change of the output between neighbouring points, until the change is below the tolerance everywhere.
+
+    Args:
+        parameter (str): name of the input parameter which is sampled
+        lower (float): lower bound of the parameter
+        upper (float): upper bound of the parameter
+        output_key (str): name of the output which is evaluated
+        tolerance (float): change of the output between neighbouring points at which the refinement stops
+        min_width (float): intervals smaller than min_width are not refined any further
+        input_dict (dict/ None): input parameters which are the same for all jobs
+        n_initial (int): number of equally spaced points of the initial batch
+    """
+
+    def __init__(
+        self,
+        parameter,
+        lower,
+        upper,
+        output_key,
+        tolerance,
+        min_width=0.0,
+        input_dict=None,
+        n_initial=5,
+    ):
+        super(RefinementStrategy, self).__init__(
+            parameter=parameter,
+            lower=lower,
+            upper=upper,
+            output_key=output_key,
+            input_dict=input_dict,
+            n_initial=n_initial,
+        )
+        self._tolerance = tolerance
+        self._min_width = min_width
+
+    def _get_next_values(self, n, finished_lst, pending_value_lst):
+        interval_lst = []
+        for (x_1, y_1), (x_2, y_2) in zip(finished_lst[:-1], finished_lst[1:]):
+            change = np.linalg.norm(np.asarray(y_2) - np.asarray(y_1))
+            if (
+                change > self._tolerance
+                and x_2 - x_1 > self._min_width
+                and not any(x_1 < v < x_2 for v in pending_value_lst)
+            ):
+                interval_lst.append((change, (x_1 + x_2) / 2))
+        return [v for _, v in sorted(interval_lst, key=lambda x: -x[0])[:n]]
@@ -0,0 +1,182 @@
+import asyncio
+from functools import partial
+import os
+import subprocess
+from .errors import SciSweeperJobError, get_error_dict
+from .timing import PhaseTimer
+
+
+async def run_job_async(job, run_again=False):
+    """
+    Execute a SciSweeperJob on the asyncio event loop. The executable is started with
+    asyncio.create_subprocess_shell(), so waiting for it does not block an operating system thread - as the event loop
+    waits for the executable, only its walltime is recorded. Writing the input, collecting the output and writing the
+    HDF5 file are executed in the default executor of the event loop.
+
+    Args:
+        job (SciSweeperJob): job to execute
+        run_again (bool): If the calculation already exists it is commonly skipped, but with this option
+                          you can force to execute the calculation again.
+
+    Returns:
+        int/ None: If the job is submitted to a queuing system the queue id is returned, else it is None.
+    """
+    loop = asyncio.get_running_loop()
+    if job.pysqa is not None:
+        return await loop.run_in_executor(None, partial(job.run, run_again=run_again))
+    if (
+        not os.path.exists(os.path.join(job.working_directory, "scisweeper.h5"))
+        or run_again
+    ):
+        job._emit(event="started")
+        try:
+            await _run_local_async(job=job)
+        except Exception as e:
+            job._record_error(exception=e)
+            job._emit(event="failed")
+            raise
+        job._clear_error()
+        job._emit(event="finished")
+    else:
+        job._emit(event="skipped")
+
+
+async def _run_local_async(job):
+    """
+    Internal function to execute a SciSweeperJob locally on the asyncio event loop and record the timing of the
+    individual phases.
+
+    Args:
+        job (SciSweeperJob): job to execute
+    """
+    loop = asyncio.get_running_loop()
+    if await loop.run_in_executor(None, job._load_from_cache):
+        await loop.run_in_executor(None, job.to_hdf)
+        return
+    timer = PhaseTimer()
+    start_time = loop.time()
+    with timer.measure("write_input"):
+        await loop.run_in_executor(
+            None,
+            partial(
+                job.write_input,
+                input_dict=job.input_dict,
+                working_directory=job.working_directory,
+            ),
+        )
+    job._emit(event="input_written")
+    executable = job.executable
+    with timer.measure("executable", cputime=False):
+        process = await asyncio.create_subprocess_shell(
+            executable,
+            cwd=job.working_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode=process.returncode, cmd=executable, output=stdout, stderr=stderr
+        )
+    job._emit(event="executable_finished")
+    with timer.measure("collect_output"):
+        job.output_dict = await loop.run_in_executor(
+            None,
+            partial(job.collect_output, working_directory=job.working_directory),
+        )
+    job._emit(event="output_collected")
+    job._walltime = loop.time() - start_time
+    await loop.run_in_executor(None, job._store_in_cache)
+    with timer.measure("to_hdf"):
+        await loop.run_in_executor(None, job.to_hdf)
+    await loop.run_in_executor(
+        None, partial(job._write_timing, timing_dict=timer.timing_dict)
+    )
+
+
+async def run_job_retry_async(job, retries=0, retry_backoff=1.0, retry_on=None):
+    """
+    Execute a SciSweeperJob on the asyncio event loop and execute it again when it fails, like
+    scisweeper.scisweeper.run_parallel() for the pool backends.
+
+    Args:
+        job (SciSweeperJob): job to execute
+        retries (int): number of times a failed job is executed again
+        retry_backoff (float): waiting time in seconds before the first retry, doubled for every further retry
+        retry_on (tuple/ None): only retry for these exception classes - all exceptions for None
+
+    Returns:
+        int/ None: If the job is submitted to a queuing system the queue id is returned, else it is None.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return await run_job_async(job=job, run_again=attempt > 0)
+        except Exception as e:
+            if attempt == retries or (
+                retry_on is not None and not isinstance(e, retry_on)
+            ):
+                if job.error is not None:
+                    error_dict = job.error.copy()
+                else:
+                    error_dict = get_error_dict(exception=e)
+                error_dict["attempts"] = attempt + 1
+                raise SciSweeperJobError(
+                    job_name=os.path.basename(job.working_directory),
+                    error_dict=error_dict,
+                )
+        await asyncio.sleep(retry_backoff * 2**attempt)
+
+
+async def run_jobs_async(
+    job_lst,
+    cores=1,
+    monitor=None,
+    retries=0,
+    retry_backoff=1.0,
+    retry_on=None,
+    finish_function=None,
+):
+    """
+    Execute multiple SciSweeperJobs on the asyncio event loop with at most cores executables running at the same time.
+    The jobs are taken from job_lst by cores worker coroutines, so a generator of jobs is consumed lazily.
+
+    Args:
+        job_lst (list/ iterable): SciSweeperJobs
+        cores (int): maximum number of concurrently running jobs
+        monitor (SweepMonitor/ None): record finished and failed jobs and stop taking new jobs when the fail fast
+                                      threshold is reached - without monitor the first failing job raises its
+                                      exception
+        retries (int): number of times a failed job is executed again
+        retry_backoff (float): waiting time in seconds before the first retry, doubled for every further retry
+        retry_on (tuple/ None): only retry for these exception classes - all exceptions for None
+        finish_function (function/ None): function without arguments which is called after all jobs finished
+
+    Returns:
+        list: list of return values of the successful jobs
+    """
+    job_iter = enumerate(job_lst)
+    result_dict = {}
+
+    async def worker():
+        for counter, job in job_iter:
+            if monitor is not None and monitor.fail_fast_triggered():
+                monitor.stopped = True
+                return
+            run_job = run_job_retry_async(
+                job=job, retries=retries, retry_backoff=retry_backoff, retry_on=retry_on
+            )
+            if monitor is None:
+                result_dict[counter] = await run_job
+            else:
+                job_name = os.path.basename(job.working_directory)
+                try:
+                    result_dict[counter] = await run_job
+                except Exception as e:
+                    monitor.record_failed(job_name=job_name, exception=e)
+                else:
+                    monitor.record_finished(job_name=job_name, walltime=job.walltime)
+
+    await asyncio.gather(*[worker() for _ in range(cores)])
+    if finish_function is not None:
+        finish_function()
+    return [result_dict[counter] for counter in sorted(result_dict.keys())]
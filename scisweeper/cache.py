@@ -0,0 +1,58 @@
+import h5io
+import os
+import tempfile
+
+
+class SciSweeperCache(object):
+    """
+    Content addressed cache for the output of completed jobs. The output is stored in an HDF5 file named by the hash
+    of the input dictionary, the executable and the write_input and collect_output source code, so it can be reused by
+    any job with the same key - in the same sweep or in a different sweep using the same cache directory.
+
+    Args:
+        path (str): cache directory
+    """
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+        os.makedirs(self._path, exist_ok=True)
+
+    @property
+    def path(self):
+        return self._path
+
+    def _get_file_name(self, key):
+        return os.path.join(self._path, key[:2], key + ".h5")
+
+    def load(self, key):
+        """
+        Load the output dictionary stored for a given key.
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            dict/ None: Output dictionary or None if the key is not cached
+        """
+        file_name = self._get_file_name(key=key)
+        if os.path.exists(file_name):
+            return h5io.read_hdf5(file_name)
+        else:
+            return None
+
+    def store(self, key, output_dict):
+        """
+        Store the output dictionary for a given key. The file is written to a temporary file first and renamed
+        afterwards, so concurrent jobs never read a partially written cache entry.
+
+        Args:
+            key (str): cache key
+            output_dict (dict): Output dictionary
+        """
+        file_name = self._get_file_name(key=key)
+        directory = os.path.dirname(file_name)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_file_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        h5io.write_hdf5(tmp_file_name, output_dict, overwrite=True)
+        os.rename(tmp_file_name, file_name)
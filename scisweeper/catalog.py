@@ -0,0 +1,138 @@
+import os
+import pickle
+import sqlite3
+from contextlib import closing
+
+
+class SciSweeperCatalog(object):
+    """
+    Sweep-wide catalog stored as SQLite database in the root directory of the sweep. Each job updates its row when
+    it is written to the HDF5 file, so the results table can be assembled with a single query instead of opening
+    every scisweeper.h5 file.
+
+    Args:
+        path (str): path of the SQLite database file
+    """
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+        with closing(self._connect()) as con:
+            with con:
+                con.execute(
+                    "CREATE TABLE IF NOT EXISTS jobs ("
+                    "path TEXT PRIMARY KEY, "
+                    "name TEXT, "
+                    "status TEXT, "
+                    "input BLOB, "
+                    "output BLOB, "
+                    "mtime REAL)"
+                )
+                column_lst = [
+                    row[1] for row in con.execute("PRAGMA table_info(jobs)").fetchall()
+                ]
+                if "mtime" not in column_lst:
+                    con.execute("ALTER TABLE jobs ADD COLUMN mtime REAL")
+
+    @property
+    def path(self):
+        return self._path
+
+    def _connect(self):
+        return sqlite3.connect(self._path, timeout=60)
+
+    def update(self, working_directory, input_dict, output_dict, status, mtime=None):
+        """
+        Insert or replace the row of an individual job.
+
+        Args:
+            working_directory (str): working directory of the job
+            input_dict (dict): Dictionary with input parameters
+            output_dict (dict): Dictionary with output parameters
+            status (str): job status, e.g. 'initialized', 'submitted' or 'finished'
+            mtime (float/ None): modification time of the scisweeper.h5 file the row corresponds to
+        """
+        working_directory = os.path.abspath(working_directory)
+        with closing(self._connect()) as con:
+            with con:
+                con.execute(
+                    "INSERT OR REPLACE INTO jobs (path, name, status, input, output, mtime) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        working_directory,
+                        os.path.basename(working_directory),
+                        status,
+                        sqlite3.Binary(pickle.dumps(input_dict, protocol=2)),
+                        sqlite3.Binary(pickle.dumps(output_dict, protocol=2)),
+                        mtime,
+                    ),
+                )
+
+    def update_mtime(self, working_directory, mtime):
+        """
+        Update the modification time of the scisweeper.h5 file of an individual job, after the HDF5 file was modified
+        without changing its input or output.
+
+        Args:
+            working_directory (str): working directory of the job
+            mtime (float): modification time of the scisweeper.h5 file
+        """
+        with closing(self._connect()) as con:
+            with con:
+                con.execute(
+                    "UPDATE jobs SET mtime = ? WHERE path = ?",
+                    (mtime, os.path.abspath(working_directory)),
+                )
+
+    def read(self, path_lst=None, mtime_dict=None):
+        """
+        Read all jobs from the catalog in one query.
+
+        Args:
+            path_lst (list/ None): only read the jobs with the given working directories
+            mtime_dict (dict/ None): Dictionary with the working directory as key and the current modification time
+                                     of its scisweeper.h5 file as value - jobs whose HDF5 file was modified after the
+                                     row was written, for example by executing the job without the catalog, are
+                                     omitted.
+
+        Returns:
+            dict: Dictionary with the working directory as key and a tuple of (status, input_dict, output_dict) as value
+        """
+        with closing(self._connect()) as con:
+            if path_lst is None:
+                rows = con.execute(
+                    "SELECT path, status, input, output, mtime FROM jobs"
+                ).fetchall()
+            else:
+                rows = []
+                for i in range(0, len(path_lst), 500):
+                    path_chunk_lst = list(path_lst[i : i + 500])
+                    rows += con.execute(
+                        "SELECT path, status, input, output, mtime FROM jobs WHERE path IN ("
+                        + ", ".join(["?"] * len(path_chunk_lst))
+                        + ")",
+                        path_chunk_lst,
+                    ).fetchall()
+        return {
+            path: (status, pickle.loads(input_blob), pickle.loads(output_blob))
+            for path, status, input_blob, output_blob, mtime in rows
+            if mtime_dict is None
+            or path not in mtime_dict.keys()
+            or _is_same_mtime(mtime_dict[path], mtime)
+        }
+
+
+def _is_same_mtime(mtime_file, mtime_catalog):
+    """
+    Internal function to compare the modification time of a scisweeper.h5 file with the one stored in the catalog,
+    using the same relative tolerance as pyfileindex.
+
+    Args:
+        mtime_file (float): modification time of the scisweeper.h5 file
+        mtime_catalog (float/ None): modification time stored in the catalog
+
+    Returns:
+        bool: True if the catalog row corresponds to the current scisweeper.h5 file
+    """
+    if mtime_catalog is None:
+        return False
+    return abs(mtime_file - mtime_catalog) <= 1e-15 + 1e-10 * abs(mtime_file)
@@ -1,6 +1,6 @@
 import sys
 import getopt
-from .scisweeper import SciSweeperJob
+from .scisweeper import SciSweeperJob, run_bundle, run_workers
 
 
 def command_line(argv):
@@ -11,9 +11,13 @@ def command_line(argv):
         argv: Command line arguments
 
     """
-    path = None
+    path, bundle, worker, cores = None, None, None, 1
     try:
-        opts, args = getopt.getopt(argv, "p:h", ["project_path=", "help"])
+        opts, args = getopt.getopt(
+            argv,
+            "p:b:w:c:h",
+            ["project_path=", "bundle=", "worker=", "cores=", "help"],
+        )
     except getopt.GetoptError:
         print("cli.py --p <path>")
         sys.exit()
@@ -21,9 +25,27 @@ def command_line(argv):
         for opt, arg in opts:
             if opt in ("-h", "--help"):
                 print("cli.py --p <path>")
+                print("cli.py --b <bundle file> --c <cores>")
+                print("cli.py --w <sweep path> --c <cores>")
                 sys.exit()
             elif opt in ("-p", "--_path"):
                 path = arg
+            elif opt in ("-b", "--bundle"):
+                bundle = arg
+            elif opt in ("-w", "--worker"):
+                worker = arg
+            elif opt in ("-c", "--cores"):
+                cores = int(arg)
+        if bundle is not None:
+            with open(bundle, "r") as f:
+                path_lst = [line.strip() for line in f.readlines() if line.strip()]
+            if len(run_bundle(working_directory_lst=path_lst, cores=cores)) > 0:
+                sys.exit(1)
+            sys.exit()
+        if worker is not None:
+            if len(run_workers(working_directory=worker, cores=cores)) > 0:
+                sys.exit(1)
+            sys.exit()
         ssw_job = SciSweeperJob(working_directory=path)
         ssw_job.from_hdf()
         ssw_job.run(run_again=True)
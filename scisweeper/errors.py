@@ -0,0 +1,189 @@
+from collections import deque
+import threading
+import traceback
+
+
+class SciSweeperJobError(Exception):
+    """
+    Raised when a SciSweeperJob failed after all retries - the error dictionary contains the exception, the exit code
+    and the tail of the standard error of the executable, the traceback and the number of attempts.
+
+    Args:
+        job_name (str): name of the job
+        error_dict (dict): error dictionary created by get_error_dict()
+    """
+
+    def __init__(self, job_name, error_dict):
+        super(SciSweeperJobError, self).__init__(job_name, error_dict)
+        self.job_name = job_name
+        self.error_dict = error_dict
+
+    def __str__(self):
+        return self.job_name + ": " + self.error_dict["exception"]
+
+
+def get_error_dict(exception, traceback_str=None, tail=2000):
+    """
+    Summarize the exception of a failed job.
+
+    Args:
+        exception (Exception): exception raised by the job
+        traceback_str (str/ None): formatted traceback of the exception
+        tail (int): number of characters kept from the end of the standard error and the traceback
+
+    Returns:
+        dict: exception, exit code and standard error of the executable - for a subprocess.CalledProcessError - and
+              the traceback
+    """
+    stderr = getattr(exception, "stderr", None)
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    if traceback_str is None:
+        traceback_str = "".join(
+            traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            )
+        )
+    return {
+        "exception": type(exception).__name__ + ": " + str(exception),
+        "returncode": getattr(exception, "returncode", None),
+        "stderr": stderr[-tail:] if stderr is not None else None,
+        "traceback": traceback_str[-tail:],
+    }
+
+
+class SweepMonitor(object):
+    """
+    Record the finished and failed jobs of SciSweeper.run_jobs_in_parallel() in the sweep manifest, collect the errors
+    of the failed jobs and evaluate the fail fast threshold. The callbacks are called from the result handler threads
+    of the pool or the executor and free the slot of the finished job, so a new job can be submitted as soon as any
+    of the submitted jobs finished.
+
+    Args:
+        manifest (SciSweeperManifest): manifest of the sweep
+        fail_fast (float/ None): stop submitting new jobs when the fraction of failed jobs among the last
+                                 fail_fast_window finished jobs reaches this threshold
+        fail_fast_window (int): number of finished jobs the failure rate is calculated for
+        max_pending (int): maximum number of submitted jobs which are not finished yet
+
+    Attributes:
+        stopped (bool): set when no further jobs were submitted, because the fail fast threshold was reached
+    """
+
+    def __init__(self, manifest, fail_fast=None, fail_fast_window=20, max_pending=1):
+        self._manifest = manifest
+        self._fail_fast = fail_fast
+        self._fail_fast_window = fail_fast_window
+        self._failed_lst = deque(maxlen=fail_fast_window)
+        self._lock = threading.Lock()
+        self._max_pending = max_pending
+        self._slots = threading.Semaphore(max_pending)
+        self.failed_dict = {}
+        self.stopped = False
+
+    def acquire_slot(self):
+        """
+        Wait until less than max_pending submitted jobs are not finished yet and reserve the slot for the next job.
+        """
+        self._slots.acquire()
+
+    def release_slot(self):
+        """
+        Release a reserved slot without submitting a job.
+        """
+        self._slots.release()
+
+    def wait(self):
+        """
+        Wait until all submitted jobs finished.
+        """
+        for _ in range(self._max_pending):
+            self._slots.acquire()
+        for _ in range(self._max_pending):
+            self._slots.release()
+
+    def record_finished(self, job_name, walltime=None):
+        """
+        Record a finished job.
+
+        Args:
+            job_name (str): name of the job
+            walltime (float/ None): walltime of the job in seconds
+        """
+        self._manifest.write(job_name=job_name, status="finished", walltime=walltime)
+        with self._lock:
+            self._failed_lst.append(False)
+
+    def record_failed(self, job_name, exception):
+        """
+        Record a failed job.
+
+        Args:
+            job_name (str): name of the job
+            exception (Exception): exception raised by the job
+        """
+        if isinstance(exception, SciSweeperJobError):
+            error_dict = exception.error_dict
+        else:
+            error_dict = get_error_dict(exception=exception)
+        self._manifest.write(job_name=job_name, status="failed")
+        with self._lock:
+            self.failed_dict[job_name] = error_dict
+            self._failed_lst.append(True)
+
+    def callback(self, job_name, walltime):
+        """
+        Callback for multiprocessing.pool.Pool.apply_async() - record a finished job.
+
+        Args:
+            job_name (str): name of the job
+            walltime (float/ None): walltime of the job in seconds
+        """
+        try:
+            self.record_finished(job_name=job_name, walltime=walltime)
+        finally:
+            self._slots.release()
+
+    def error_callback(self, job_name, exception):
+        """
+        Error callback for multiprocessing.pool.Pool.apply_async() - record a failed job.
+
+        Args:
+            job_name (str): name of the job
+            exception (Exception): exception raised by the job
+        """
+        try:
+            self.record_failed(job_name=job_name, exception=exception)
+        finally:
+            self._slots.release()
+
+    def future_callback(self, job_name, future):
+        """
+        Callback for concurrent.futures.Future.add_done_callback() - record a finished or failed job.
+
+        Args:
+            job_name (str): name of the job
+            future (Future): finished future of the job
+        """
+        try:
+            if future.exception() is None:
+                self.record_finished(job_name=job_name, walltime=future.result())
+            else:
+                self.record_failed(job_name=job_name, exception=future.exception())
+        finally:
+            self._slots.release()
+
+    def fail_fast_triggered(self):
+        """
+        Check the fail fast threshold.
+
+        Returns:
+            bool: True if the failure rate of the last fail_fast_window jobs reached the threshold
+        """
+        if self._fail_fast is None:
+            return False
+        with self._lock:
+            return (
+                len(self._failed_lst) == self._fail_fast_window
+                and sum(self._failed_lst) >= self._fail_fast * self._fail_fast_window
+            )
@@ -0,0 +1,256 @@
+import h5io
+import h5py
+import numpy as np
+import time
+
+
+def split_native_output(output_dict):
+    """
+    Split the output dictionary in the part which can be stored natively - numerical arrays as datasets and scalars
+    as attributes - and the remaining part which is stored with h5io.
+
+    Args:
+        output_dict (dict): Output dictionary
+
+    Returns:
+        dict, dict: output stored with h5io, output stored natively
+    """
+    h5io_dict, native_dict = {}, {}
+    for k, v in output_dict.items():
+        if isinstance(v, (bool, int, float, str, np.generic)) or (
+            isinstance(v, np.ndarray) and v.dtype.kind in "biufc"
+        ):
+            native_dict[k] = v
+        else:
+            h5io_dict[k] = v
+    return h5io_dict, native_dict
+
+
+def write_native_output(file_name, output_dict, compression=None):
+    """
+    Write the output dictionary to the output_native group of the HDF5 file. Arrays are stored as chunked datasets,
+    which are optionally compressed, and scalars are stored as attributes of the group.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        output_dict (dict): Output dictionary with numerical arrays and scalars
+        compression (str/ None): HDF5 compression filter for the datasets - 'gzip', 'lzf' or None
+    """
+    with _open_file(file_name=file_name, mode="a") as f:
+        if "output_native" in f:
+            del f["output_native"]
+        group = f.create_group("output_native")
+        for k, v in output_dict.items():
+            if isinstance(v, np.ndarray) and v.ndim > 0:
+                if v.size > 0:
+                    group.create_dataset(
+                        k, data=v, chunks=True, compression=compression
+                    )
+                else:
+                    group.create_dataset(k, data=v)
+            else:
+                group.attrs[k] = v
+
+
+def read_native_output(file_name, key_lst=None):
+    """
+    Read the output dictionary from the output_native group of the HDF5 file.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        key_lst (list/ None): only read the given keys
+
+    Returns:
+        dict: Output dictionary
+    """
+    with _open_file(file_name=file_name, mode="r") as f:
+        return _read_native_group(f=f, key_lst=key_lst)
+
+
+def read_keys(file_name, input_key_lst=None, output_key_lst=None):
+    """
+    Read only selected input and output keys from the HDF5 file of a job, skipping the settings and the stored
+    function source code. The selected keys are read with the internal reader of h5io - when it is not available in
+    the installed h5io version or the file does not have the expected h5io layout, the whole file is read with
+    h5io.read_hdf5() instead.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        input_key_lst (list/ None): input keys to read - all input keys for None
+        output_key_lst (list/ None): output keys to read - all output keys for None
+
+    Returns:
+        dict, dict: input dictionary and output dictionary
+    """
+    triage_read = _get_triage_read()
+    with _open_file(file_name=file_name, mode="r") as f:
+        if triage_read is not None and _is_h5io_dict(f=f, group_name="h5io"):
+            input_dict = _read_group_keys(
+                f=f,
+                group_name="h5io/key_input",
+                key_lst=input_key_lst,
+                triage_read=triage_read,
+            )
+            output_dict = _read_group_keys(
+                f=f,
+                group_name="h5io/key_output",
+                key_lst=output_key_lst,
+                triage_read=triage_read,
+            )
+            output_dict.update(_read_native_group(f=f, key_lst=output_key_lst))
+            return input_dict, output_dict
+        native_dict = _read_native_group(f=f, key_lst=output_key_lst)
+    job_dict = h5io.read_hdf5(file_name)
+    input_dict = _select_keys(job_dict.get("input", {}), key_lst=input_key_lst)
+    output_dict = _select_keys(job_dict.get("output", {}), key_lst=output_key_lst)
+    output_dict.update(native_dict)
+    return input_dict, output_dict
+
+
+def _get_triage_read():
+    """
+    Internal function to import the internal reader of h5io, which reads an individual group of an h5io file.
+
+    Returns:
+        function/ None: h5io._h5io._triage_read - None if it is not available in the installed h5io version
+    """
+    try:
+        from h5io._h5io import _triage_read
+    except ImportError:
+        return None
+    return _triage_read
+
+
+def _is_h5io_dict(f, group_name):
+    """
+    Internal function to check if a group of the HDF5 file is a dictionary stored with h5io.
+
+    Args:
+        f (h5py.File): open HDF5 file
+        group_name (str): path of the group
+
+    Returns:
+        bool: True if the group exists and is marked as h5io dictionary
+    """
+    if group_name not in f:
+        return False
+    title = f[group_name].attrs.get("TITLE")
+    if isinstance(title, bytes):
+        title = title.decode()
+    return title == "dict"
+
+
+def _select_keys(value_dict, key_lst=None):
+    """
+    Internal function to select keys of a dictionary.
+
+    Args:
+        value_dict (dict): dictionary
+        key_lst (list/ None): keys to select - all keys for None
+
+    Returns:
+        dict: dictionary with the selected keys
+    """
+    if key_lst is None:
+        return dict(value_dict)
+    return {k: v for k, v in value_dict.items() if k in key_lst}
+
+
+def _read_group_keys(f, group_name, triage_read, key_lst=None):
+    """
+    Read selected keys of a dictionary stored with h5io.
+
+    Args:
+        f (h5py.File): open HDF5 file
+        group_name (str): path of the h5io dictionary group
+        triage_read (function): internal reader of h5io
+        key_lst (list/ None): keys to read - all keys for None
+
+    Returns:
+        dict: dictionary with the selected keys
+    """
+    if group_name not in f:
+        return {}
+    group = f[group_name]
+    if key_lst is None:
+        return triage_read(group)
+    return {k: triage_read(group["key_" + k]) for k in key_lst if "key_" + k in group}
+
+
+def _read_native_group(f, key_lst=None):
+    """
+    Read selected keys of the output_native group.
+
+    Args:
+        f (h5py.File): open HDF5 file
+        key_lst (list/ None): keys to read - all keys for None
+
+    Returns:
+        dict: dictionary with the selected keys
+    """
+    output_dict = {}
+    if "output_native" in f:
+        group = f["output_native"]
+        for k, v in group.attrs.items():
+            if key_lst is None or k in key_lst:
+                output_dict[k] = v
+        for k in group.keys():
+            if key_lst is None or k in key_lst:
+                output_dict[k] = group[k][()]
+    return output_dict
+
+
+def write_timing(file_name, timing_dict):
+    """
+    Write the per phase timing of a job as attributes of the timing group of the HDF5 file.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        timing_dict (dict): walltime, CPU time and peak RSS of the individual phases
+    """
+    with _open_file(file_name=file_name, mode="a") as f:
+        if "timing" in f:
+            del f["timing"]
+        group = f.create_group("timing")
+        for k, v in timing_dict.items():
+            group.attrs[k] = v
+
+
+def read_timing(file_name):
+    """
+    Read the per phase timing of a job from the HDF5 file.
+
+    Args:
+        file_name (str): path of the HDF5 file
+
+    Returns:
+        dict: walltime, CPU time and peak RSS of the individual phases - empty if no timing was recorded
+    """
+    with _open_file(file_name=file_name, mode="r") as f:
+        if "timing" in f:
+            return {k: v.item() for k, v in f["timing"].attrs.items()}
+        return {}
+
+
+def _open_file(file_name, mode="r", attempts=10):
+    """
+    Internal function to open an HDF5 file with h5py. A subprocess started by another thread inherits the open file
+    descriptors - and with them the HDF5 file lock - until it starts the executable, so opening a file which was just
+    closed can fail temporarily when the jobs are executed in threads. In this case the file is opened again after a
+    short delay.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        mode (str): file mode
+        attempts (int): maximum number of attempts to open the file
+
+    Returns:
+        h5py.File: open HDF5 file
+    """
+    for attempt in range(attempts):
+        try:
+            return h5py.File(file_name, mode=mode)
+        except BlockingIOError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.001 * 2**attempt)
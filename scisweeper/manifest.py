@@ -0,0 +1,79 @@
+import os
+import threading
+
+
+class SciSweeperManifest(object):
+    """
+    Append-only record of the jobs of a sweep which finished or failed, one tab separated line of status, job name and
+    optionally the walltime in seconds per job. When a sweep is restarted, a single read of the manifest is sufficient
+    to skip the finished jobs without touching their working directories.
+
+    Args:
+        path (str): path of the manifest file
+    """
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._path
+
+    def read(self):
+        """
+        Read the manifest - for jobs which are listed multiple times the last status is used.
+
+        Returns:
+            dict: Dictionary with the job name as key and the status as value
+        """
+        return {job_name: status for status, job_name, _ in self._read_lines()}
+
+    def read_walltime(self):
+        """
+        Read the recorded walltimes of the finished jobs.
+
+        Returns:
+            dict: Dictionary with the job name as key and the walltime in seconds as value
+        """
+        return {
+            job_name: walltime
+            for status, job_name, walltime in self._read_lines()
+            if status == "finished" and walltime is not None
+        }
+
+    def write(self, job_name, status, walltime=None):
+        """
+        Append the status of a job to the manifest.
+
+        Args:
+            job_name (str): name of the job - the name of its working directory
+            status (str): 'finished' or 'failed'
+            walltime (float/ None): walltime of the job in seconds
+        """
+        line = status + "\t" + job_name
+        if walltime is not None:
+            line += "\t" + repr(float(walltime))
+        with self._lock:
+            with open(self._path, "a") as f:
+                f.write(line + "\n")
+
+    def _read_lines(self):
+        """
+        Internal helper function to parse the lines of the manifest.
+
+        Returns:
+            list: list of (status, job name, walltime) tuples - the walltime is None if it was not recorded
+        """
+        line_lst = []
+        if os.path.exists(self._path):
+            with open(self._path, "r") as f:
+                for line in f:
+                    line_split = line.rstrip("\n").split("\t")
+                    if len(line_split) == 2:
+                        line_lst.append((line_split[0], line_split[1], None))
+                    elif len(line_split) == 3:
+                        line_lst.append(
+                            (line_split[0], line_split[1], float(line_split[2]))
+                        )
+        return line_lst
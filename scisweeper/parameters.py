@@ -0,0 +1,116 @@
+import itertools
+import numpy as np
+
+
+def grid(**axes):
+    """
+    Lazily generate the full grid of all combinations of the parameter axes.
+
+    Args:
+        **axes: parameter name and list of values for each axis
+
+    Returns:
+        generator: input dictionaries
+    """
+    key_lst = list(axes.keys())
+    for value_lst in itertools.product(*axes.values()):
+        yield dict(zip(key_lst, value_lst))
+
+
+def zip_axes(**axes):
+    """
+    Lazily generate input dictionaries from parameter axes of equal length, taking the i-th value of each axis for the
+    i-th input dictionary.
+
+    Args:
+        **axes: parameter name and list of values for each axis
+
+    Returns:
+        generator: input dictionaries
+    """
+    key_lst = list(axes.keys())
+    for value_lst in zip(*axes.values()):
+        yield dict(zip(key_lst, value_lst))
+
+
+def random_samples(n, seed=None, chunk_size=1000, **bounds):
+    """
+    Lazily generate n input dictionaries with parameters drawn uniformly at random.
+
+    Args:
+        n (int): number of input dictionaries
+        seed (int/ None): seed of the random number generator
+        chunk_size (int): number of samples which are drawn at once
+        **bounds: parameter name and (lower, upper) bound for each parameter
+
+    Returns:
+        generator: input dictionaries
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunk_size):
+        sample_arr = rng.random((min(chunk_size, n - start), len(bounds)))
+        for input_dict in _scale_samples(sample_arr=sample_arr, bounds=bounds):
+            yield input_dict
+
+
+def latin_hypercube(n, seed=None, **bounds):
+    """
+    Lazily generate n input dictionaries from a Latin hypercube sample - each parameter range is divided in n
+    intervals of equal size and each interval is sampled exactly once. Only the n random positions per parameter are
+    kept in memory, the input dictionaries are generated on demand.
+
+    Args:
+        n (int): number of input dictionaries
+        seed (int/ None): seed of the random number generator
+        **bounds: parameter name and (lower, upper) bound for each parameter
+
+    Returns:
+        generator: input dictionaries
+    """
+    rng = np.random.default_rng(seed)
+    sample_arr = np.array(
+        [(rng.permutation(n) + rng.random(n)) / n for _ in range(len(bounds))]
+    ).T
+    for input_dict in _scale_samples(sample_arr=sample_arr, bounds=bounds):
+        yield input_dict
+
+
+def sobol(n, seed=None, scramble=True, chunk_size=1024, **bounds):
+    """
+    Lazily generate n input dictionaries from a Sobol low discrepancy sequence. This requires scipy >= 1.7.
+
+    Args:
+        n (int): number of input dictionaries - powers of two preserve the balance properties of the sequence
+        seed (int/ None): seed of the scrambling
+        scramble (bool): scramble the sequence
+        chunk_size (int): number of samples which are drawn at once
+        **bounds: parameter name and (lower, upper) bound for each parameter
+
+    Returns:
+        generator: input dictionaries
+    """
+    from scipy.stats import qmc
+
+    sampler = qmc.Sobol(d=len(bounds), scramble=scramble, seed=seed)
+    for start in range(0, n, chunk_size):
+        sample_arr = sampler.random(min(chunk_size, n - start))
+        for input_dict in _scale_samples(sample_arr=sample_arr, bounds=bounds):
+            yield input_dict
+
+
+def _scale_samples(sample_arr, bounds):
+    """
+    Internal function to scale samples from the unit hypercube to the parameter bounds.
+
+    Args:
+        sample_arr (numpy.ndarray): samples in the unit hypercube with one column per parameter
+        bounds (dict): parameter name and (lower, upper) bound for each parameter
+
+    Returns:
+        generator: input dictionaries
+    """
+    key_lst = list(bounds.keys())
+    lower_arr = np.array([b[0] for b in bounds.values()], dtype=float)
+    upper_arr = np.array([b[1] for b in bounds.values()], dtype=float)
+    for sample in lower_arr + sample_arr * (upper_arr - lower_arr):
+        yield dict(zip(key_lst, sample.tolist()))
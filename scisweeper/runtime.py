@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class RuntimeModel(object):
+    """
+    Simple model of the walltime of a job as linear function of its numerical input parameters, fitted by least squares
+    to the recorded walltimes of the finished jobs. It is used to execute the jobs with the longest expected walltime
+    first - when less than two walltimes are available all jobs have the same expected walltime.
+    """
+
+    def __init__(self):
+        self._key_lst = []
+        self._coefficient_arr = None
+        self._mean_walltime = 0.0
+        self._min_walltime = 0.0
+
+    def fit(self, input_dict_lst, walltime_lst):
+        """
+        Fit the model to the walltimes of the finished jobs.
+
+        Args:
+            input_dict_lst (list): input dictionaries of the finished jobs
+            walltime_lst (list): walltimes of the finished jobs in seconds
+        """
+        if len(walltime_lst) == 0:
+            return
+        walltime_arr = np.array(walltime_lst, dtype=float)
+        self._mean_walltime = float(np.mean(walltime_arr))
+        self._min_walltime = float(np.min(walltime_arr))
+        if len(walltime_lst) < 2:
+            return
+        self._key_lst = [
+            k
+            for k, v in input_dict_lst[0].items()
+            if all(_is_number(input_dict.get(k)) for input_dict in input_dict_lst)
+        ]
+        self._coefficient_arr, _, _, _ = np.linalg.lstsq(
+            self._get_feature_arr(input_dict_lst=input_dict_lst),
+            walltime_arr,
+            rcond=None,
+        )
+
+    def predict(self, input_dict):
+        """
+        Predict the walltime of a job.
+
+        Args:
+            input_dict (dict): input dictionary of the job
+
+        Returns:
+            float: expected walltime in seconds
+        """
+        if self._coefficient_arr is None or not all(
+            _is_number(input_dict.get(k)) for k in self._key_lst
+        ):
+            return self._mean_walltime
+        return max(
+            float(
+                np.dot(
+                    self._get_feature_arr(input_dict_lst=[input_dict])[0],
+                    self._coefficient_arr,
+                )
+            ),
+            self._min_walltime,
+        )
+
+    def _get_feature_arr(self, input_dict_lst):
+        return np.array(
+            [
+                [1.0] + [float(input_dict[k]) for k in self._key_lst]
+                for input_dict in input_dict_lst
+            ]
+        )
+
+
+def _is_number(value):
+    """
+    Internal function to check if an input parameter is a number - booleans are excluded.
+
+    Args:
+        value: input parameter
+
+    Returns:
+        bool: True for integers and floats
+    """
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, (bool, np.bool_)
+    )
@@ -1,15 +1,36 @@
+from functools import partial
 import h5io
+import hashlib
 import inspect
+import json
+from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 import numpy as np
 import os
-import pandas
-from pyfileindex import PyFileIndex
-from pysqa import QueueAdapter
-import subprocess
-import sys
-from tqdm import tqdm
+import pickle
+import socket
+import tempfile
 import textwrap
+import time
+import traceback
+import warnings
+from .errors import SciSweeperJobError, SweepMonitor, get_error_dict
+from .hdf import (
+    split_native_output,
+    write_native_output,
+    read_native_output,
+    read_keys,
+    write_timing,
+    read_timing,
+)
+from .timing import PhaseTimer, phase_lst
+
+# Process wide caches for the functions restored from their source code and the implementation status of the methods
+# of the SciSweeperJob classes.
+_function_cache = {}
+_implemented_cache = {}
+_source_cache = {}
+_definition_cache = {}
 
 
 def filter_function(file_name):
@@ -25,23 +46,393 @@ def filter_function(file_name):
     return "scisweeper.h5" in file_name
 
 
-def run_parallel(scisweeper, working_directory, input_dict):
+def run_parallel(
+    job_class,
+    job_kwargs,
+    working_directory,
+    input_dict,
+    retries=0,
+    retry_backoff=1.0,
+    retry_on=None,
+):
     """
     Internal function to execute SciSweeperJobs in parallel
 
     Args:
-        ssw (SciSweeper): SciSweeper Instance
+        job_class (class): SciSweeperJob class
+        job_kwargs (dict): sweep wide keyword arguments of the job, like the catalog and the definitions directory
+        working_directory (str): working directory where the calculation should be executed
+        input_dict (dict): Dictionary with input parameters
+        retries (int): number of times a failed job is executed again
+        retry_backoff (float): waiting time in seconds before the first retry, doubled for every further retry
+        retry_on (tuple/ None): only retry for these exception classes - all exceptions for None
+
+    Returns:
+        float/ None: walltime of the calculation in seconds, None if it was not executed
+    """
+    for attempt in range(retries + 1):
+        job = job_class(
+            working_directory=working_directory, input_dict=input_dict, **job_kwargs
+        )
+        try:
+            job.run(run_again=attempt > 0)
+            return job.walltime
+        except Exception as e:
+            if attempt == retries or (
+                retry_on is not None and not isinstance(e, retry_on)
+            ):
+                if job.error is not None:
+                    error_dict = job.error.copy()
+                else:
+                    error_dict = get_error_dict(exception=e)
+                error_dict["attempts"] = attempt + 1
+                raise SciSweeperJobError(
+                    job_name=os.path.basename(working_directory), error_dict=error_dict
+                )
+        time.sleep(retry_backoff * 2**attempt)
+
+
+def run_adaptive_job(job_class, job_kwargs, working_directory, input_dict):
+    """
+    Internal function to execute a SciSweeperJob of an adaptive sweep and return its input and output
+
+    Args:
+        job_class (class): SciSweeperJob class
+        job_kwargs (dict): sweep wide keyword arguments of the job, like the catalog and the definitions directory
         working_directory (str): working directory where the calculation should be executed
         input_dict (dict): Dictionary with input parameters
+
+    Returns:
+        tuple: input dictionary and output dictionary of the job
+    """
+    job = job_class(
+        working_directory=working_directory, input_dict=input_dict, **job_kwargs
+    )
+    job.run()
+    if len(job.output_dict) == 0:
+        job.from_hdf()
+    return job.input_dict, job.output_dict
+
+
+def run_from_hdf(working_directory, run_again=True):
+    """
+    Internal function to restore a SciSweeperJob from its HDF5 file and execute it
+
+    Args:
+        working_directory (str): working directory of the calculation
+        run_again (bool): execute the calculation even if it already has output
+    """
+    job = SciSweeperJob(working_directory=working_directory)
+    job.from_hdf()
+    if run_again or len(job.output_dict) == 0:
+        job.run(run_again=True)
+
+
+def run_bundle(working_directory_lst, cores=1):
+    """
+    Internal function to execute a bundle of SciSweeperJobs which were previously stored in their HDF5 files. A
+    failing job does not stop the remaining jobs of the bundle.
+
+    Args:
+        working_directory_lst (list): list of working directories
+        cores (int): number of jobs which are executed in parallel
+
+    Returns:
+        list: list of working directories of the failed jobs
+    """
+    if cores == 1:
+        error_lst = [run_bundle_job(path) for path in working_directory_lst]
+    else:
+        pool = Pool(cores)
+        try:
+            error_lst = pool.map(run_bundle_job, working_directory_lst, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    return [path for path, error in zip(working_directory_lst, error_lst) if error]
+
+
+def run_bundle_job(working_directory):
+    """
+    Internal function to execute an individual job of a bundle
+
+    Args:
+        working_directory (str): working directory of the calculation
+
+    Returns:
+        bool: True if the calculation failed
+    """
+    try:
+        run_from_hdf(working_directory=working_directory)
+    except Exception:
+        traceback.print_exc()
+        return True
+    else:
+        return False
+
+
+def claim_job(working_directory):
+    """
+    Internal function to claim a job directory for a pilot worker. The claim file is created atomically, so each job
+    directory is claimed by exactly one worker - even when the workers run on different nodes of a shared file system.
+    The claim does not expire: when the job fails or the worker is killed, the job is only claimed again after the
+    scisweeper.claim file is removed.
+
+    Args:
+        working_directory (str): working directory of the calculation
+
+    Returns:
+        bool: True if the job was claimed by this worker
+    """
+    try:
+        fd = os.open(
+            os.path.join(working_directory, "scisweeper.claim"),
+            os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+        )
+    except OSError:
+        return False
+    try:
+        os.write(fd, (socket.gethostname() + " " + str(os.getpid())).encode())
+    finally:
+        os.close(fd)
+    return True
+
+
+def run_worker(working_directory):
+    """
+    Internal function for a pilot worker, which repeatedly claims unstarted jobs in the sweep directory and executes
+    them, until no further job can be claimed.
+
+    Args:
+        working_directory (str): root directory of the sweep
+
+    Returns:
+        list: list of working directories of the failed jobs
+    """
+    failed_lst = []
+    while True:
+        claimed = False
+        for path, _, file_lst in os.walk(working_directory):
+            if "scisweeper.h5" in file_lst and claim_job(working_directory=path):
+                claimed = True
+                try:
+                    run_from_hdf(working_directory=path, run_again=False)
+                except Exception:
+                    traceback.print_exc()
+                    failed_lst.append(path)
+        if not claimed:
+            return failed_lst
+
+
+def run_workers(working_directory, cores=1):
+    """
+    Internal function to start multiple pilot workers for the same sweep directory.
+
+    Args:
+        working_directory (str): root directory of the sweep
+        cores (int): number of pilot workers
+
+    Returns:
+        list: list of working directories of the failed jobs
+    """
+    if cores == 1:
+        return run_worker(working_directory=working_directory)
+    pool = Pool(cores)
+    try:
+        failed_lst = pool.map(run_worker, [working_directory] * cores, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return [path for worker_lst in failed_lst for path in worker_lst]
+
+
+def read_parallel(job_class, working_directory):
+    """
+    Internal function to read SciSweeperJobs in parallel
+
+    Args:
+        job_class (class): SciSweeperJob class
+        working_directory (str): working directory of the calculation
+
+    Returns:
+        tuple: input dictionary and output dictionary
+    """
+    job = job_class(working_directory=working_directory)
+    job.from_hdf()
+    return job.input_dict, job.output_dict
+
+
+def read_timing_parallel(working_directory):
+    """
+    Internal function to read the per phase timing of SciSweeperJobs in parallel
+
+    Args:
+        working_directory (str): working directory of the calculation
+
+    Returns:
+        dict: walltime, CPU time and peak RSS of the individual phases
+    """
+    return read_timing(file_name=os.path.join(working_directory, "scisweeper.h5"))
+
+
+def read_keys_parallel(input_key_lst, output_key_lst, working_directory):
+    """
+    Internal function to read selected input and output keys of SciSweeperJobs in parallel
+
+    Args:
+        input_key_lst (list/ None): input keys to read - all input keys for None
+        output_key_lst (list/ None): output keys to read - all output keys for None
+        working_directory (str): working directory of the calculation
+
+    Returns:
+        tuple: input dictionary and output dictionary
+    """
+    return read_keys(
+        file_name=os.path.join(working_directory, "scisweeper.h5"),
+        input_key_lst=input_key_lst,
+        output_key_lst=output_key_lst,
+    )
+
+
+def collect_output_parallel(job_class, job_kwargs, working_directory):
+    """
+    Internal function to collect the output of SciSweeperJobs in parallel
+
+    Args:
+        job_class (class): SciSweeperJob class
+        job_kwargs (dict): sweep wide keyword arguments of the job, like the catalog and the definitions directory
+        working_directory (str): working directory of the calculation
+    """
+    job_class(working_directory=working_directory, **job_kwargs).run_collect_output()
+
+
+def _get_hashable(obj):
+    """
+    Internal function to convert an input parameter to a JSON serializable representation for the cache key. NumPy
+    arrays are represented by their dtype, their shape and the hash of their contents and NumPy scalars are converted
+    to the corresponding Python scalars, so np.int64(1) and 1 result in the same cache key.
+
+    Args:
+        obj: input parameter
+
+    Returns:
+        JSON serializable representation of the input parameter
+    """
+    if isinstance(obj, dict):
+        return {str(k): _get_hashable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_get_hashable(v) for v in obj]
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return {
+                "shape": list(obj.shape),
+                "values": [_get_hashable(v) for v in obj.ravel().tolist()],
+            }
+        return {
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "sha1": hashlib.sha1(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+        }
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    else:
+        return obj
+
+
+def compact_column(values, sparse_threshold=0.1, categorical_threshold=0.5):
+    """
+    Internal function to convert a column of the results table to a memory compact representation. Numbers are
+    converted to numeric arrays - or sparse arrays when they are only present for a small fraction of the jobs -,
+    repeated strings to categoricals and equal length arrays to rows of a contiguous 2D numpy array. All other columns
+    are returned unchanged.
+
+    Args:
+        values (list): values of the column with np.nan for missing values
+        sparse_threshold (float): maximum fraction of present values for sparse storage
+        categorical_threshold (float): maximum ratio of unique to present strings for categorical storage
+
+    Returns:
+        list/ numpy.ndarray/ pandas.Categorical/ pandas.arrays.SparseArray: compact column
+    """
+    import pandas
+
+    present_lst = [v for v in values if not (isinstance(v, float) and np.isnan(v))]
+    if len(present_lst) == 0:
+        return values
+    missing = len(present_lst) < len(values)
+    if all(isinstance(v, (bool, np.bool_)) for v in present_lst):
+        if missing:
+            return values
+        return np.array(values, dtype=bool)
+    if all(isinstance(v, (int, float, np.integer, np.floating)) for v in present_lst):
+        if missing:
+            array = np.array(values, dtype=float)
+        else:
+            array = np.array(values)
+        if len(present_lst) < sparse_threshold * len(values):
+            return pandas.arrays.SparseArray(array, fill_value=np.nan)
+        return array
+    if all(isinstance(v, str) for v in present_lst):
+        if len(set(present_lst)) <= categorical_threshold * len(present_lst):
+            return pandas.Categorical(values)
+        return values
+    if not missing and all(isinstance(v, (list, tuple, np.ndarray)) for v in values):
+        try:
+            block = np.array(values)
+        except ValueError:
+            return values
+        if block.dtype.kind in "biufc" and block.ndim > 1:
+            return list(block)
+    return values
+
+
+def map_parallel(function, argument_lst, cores=1):
+    """
+    Internal function to map a function over a list of arguments - in a process pool for more than one core, as h5py
+    holds the global HDF5 lock. The order of the results matches the order of the arguments.
+
+    Args:
+        function (function): function with a single argument
+        argument_lst (list): list of arguments
+        cores (int): number of worker processes
+
+    Returns:
+        list: list of results
     """
-    return scisweeper.job_class(
-        working_directory=working_directory, input_dict=input_dict
-    ).run()
+    from tqdm import tqdm
+
+    if cores == 1 or len(argument_lst) < 2:
+        return [function(argument) for argument in tqdm(argument_lst)]
+    pool = Pool(min(cores, len(argument_lst)))
+    try:
+        return list(
+            tqdm(
+                pool.imap(
+                    function,
+                    argument_lst,
+                    chunksize=max(1, len(argument_lst) // (cores * 4)),
+                ),
+                total=len(argument_lst),
+            )
+        )
+    finally:
+        pool.close()
+        pool.join()
 
 
 class SciSweeperJob(object):
     def __init__(
-        self, working_directory=None, input_dict=None, pysqa_config=None, cores=1
+        self,
+        working_directory=None,
+        input_dict=None,
+        pysqa_config=None,
+        cores=1,
+        catalog=None,
+        definitions=None,
+        output_storage="h5io",
+        output_compression=None,
+        cache=None,
+        event_callback=None,
     ):
         self._working_directory = None
         self.working_directory = working_directory
@@ -56,6 +447,20 @@ class SciSweeperJob(object):
         self._pysqa = None
         self.pysqa = pysqa_config
         self._cores = cores
+        self._catalog = None
+        self.catalog = catalog
+        self._definitions = None
+        self.definitions = definitions
+        self._output_storage = None
+        self.output_storage = output_storage
+        self._output_compression = output_compression
+        self._cache = None
+        self.cache = cache
+        self._walltime = None
+        self._cache_key = None
+        self._timing = None
+        self._event_callback = event_callback
+        self._error = None
 
     @property
     def pysqa(self):
@@ -64,10 +469,85 @@ class SciSweeperJob(object):
     @pysqa.setter
     def pysqa(self, pysqa_config):
         if isinstance(pysqa_config, str):
+            from pysqa import QueueAdapter
+
             self._pysqa = QueueAdapter(pysqa_config)
         else:
             self._pysqa = pysqa_config
 
+    @property
+    def catalog(self):
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, catalog):
+        if isinstance(catalog, str):
+            from .catalog import SciSweeperCatalog
+
+            self._catalog = SciSweeperCatalog(catalog)
+        else:
+            self._catalog = catalog
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        if isinstance(cache, str):
+            from .cache import SciSweeperCache
+
+            self._cache = SciSweeperCache(cache)
+        else:
+            self._cache = cache
+
+    @property
+    def walltime(self):
+        return self._walltime
+
+    @property
+    def timing(self):
+        if self._timing is None:
+            file_name = os.path.join(self._working_directory, "scisweeper.h5")
+            if os.path.exists(file_name):
+                self._timing = read_timing(file_name=file_name)
+            else:
+                self._timing = {}
+        return self._timing
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def definitions(self):
+        return self._definitions
+
+    @definitions.setter
+    def definitions(self, definitions):
+        if definitions is not None:
+            self._definitions = os.path.abspath(definitions)
+        else:
+            self._definitions = None
+
+    @property
+    def output_storage(self):
+        return self._output_storage
+
+    @output_storage.setter
+    def output_storage(self, output_storage):
+        if output_storage not in ["h5io", "native"]:
+            raise ValueError("The output_storage has to be 'h5io' or 'native'.")
+        self._output_storage = output_storage
+
+    @property
+    def output_compression(self):
+        return self._output_compression
+
+    @output_compression.setter
+    def output_compression(self, output_compression):
+        self._output_compression = output_compression
+
     @property
     def cores(self):
         return self._cores
@@ -83,11 +563,7 @@ class SciSweeperJob(object):
     @working_directory.setter
     def working_directory(self, working_directory):
         self._working_directory = os.path.abspath(working_directory)
-        if sys.version_info[0] >= 3:
-            os.makedirs(self._working_directory, exist_ok=True)
-        else:
-            if not os.path.exists(self._working_directory):
-                os.makedirs(self._working_directory)
+        os.makedirs(self._working_directory, exist_ok=True)
 
     @property
     def input_dict(self):
@@ -114,7 +590,7 @@ class SciSweeperJob(object):
     @staticmethod
     def _obj_to_str(obj):
         """
-        Convert a function to a string for storing in the HDF5 file
+        Convert a function to a string for storing in the HDF5 file - the source code is cached per function object.
 
         Args:
             obj(function): function object
@@ -122,12 +598,15 @@ class SciSweeperJob(object):
         Returns:
             str: function source code
         """
-        return inspect.getsource(obj)
+        if obj not in _source_cache.keys():
+            _source_cache[obj] = inspect.getsource(obj)
+        return _source_cache[obj]
 
     @staticmethod
     def _str_to_obj(obj_str):
         """
-        Convert function source code to a function
+        Convert function source code to a function - the compiled functions are cached by the hash of their source
+        code, so restoring many jobs of the same class compiles the source code only once per process.
 
         Args:
             obj_str (str): function source code
@@ -135,10 +614,31 @@ class SciSweeperJob(object):
         Returns:
             function: resulting function
         """
-        function_dedent_str = textwrap.dedent(obj_str)
-        function_dedent_str = function_dedent_str.replace("@staticmethod", "")
-        exec(function_dedent_str)
-        return eval(function_dedent_str.split("(")[0][4:])
+        source_hash = hashlib.sha1(obj_str.encode("utf-8")).hexdigest()
+        if source_hash not in _function_cache.keys():
+            function_dedent_str = textwrap.dedent(obj_str)
+            function_dedent_str = function_dedent_str.replace("@staticmethod", "")
+            exec(function_dedent_str)
+            _function_cache[source_hash] = eval(function_dedent_str.split("(")[0][4:])
+        return _function_cache[source_hash]
+
+    @classmethod
+    def _is_implemented(cls, function_name):
+        """
+        Check if a method of the class is implemented by the user - the result is cached per class.
+
+        Args:
+            function_name (str): name of the method, e.g. 'write_input' or 'collect_output'
+
+        Returns:
+            bool: [True/ False]
+        """
+        if (cls, function_name) not in _implemented_cache.keys():
+            _implemented_cache[(cls, function_name)] = (
+                "NotImplementedError"
+                not in inspect.getsource(getattr(cls, function_name))
+            )
+        return _implemented_cache[(cls, function_name)]
 
     @staticmethod
     def write_input(input_dict, working_directory="."):
@@ -164,9 +664,59 @@ class SciSweeperJob(object):
         """
         raise NotImplementedError
 
-    def to_hdf(self):
+    def _store_definition(self, obj_str):
+        """
+        Store function source code in the content addressed definitions directory of the sweep, unless it is already
+        stored there.
+
+        Args:
+            obj_str (str): function source code
+
+        Returns:
+            str: SHA1 hash of the function source code
+        """
+        source_hash = hashlib.sha1(obj_str.encode("utf-8")).hexdigest()
+        file_name = os.path.join(self._definitions, source_hash + ".py")
+        if file_name not in _definition_cache.keys():
+            if not os.path.exists(file_name):
+                os.makedirs(self._definitions, exist_ok=True)
+                fd, tmp_file_name = tempfile.mkstemp(dir=self._definitions)
+                with os.fdopen(fd, "w") as f:
+                    f.write(obj_str)
+                os.rename(tmp_file_name, file_name)
+            _definition_cache[file_name] = obj_str
+        return source_hash
+
+    @staticmethod
+    def _load_definition(settings_dict, function_name):
+        """
+        Load function source code either directly from the settings of the job or - for jobs which reference the
+        source code by its hash - from the definitions directory of the sweep.
+
+        Args:
+            settings_dict (dict): settings dictionary stored in the HDF5 file
+            function_name (str): name of the method, e.g. 'write_input' or 'collect_output'
+
+        Returns:
+            str: function source code
+        """
+        if function_name in settings_dict.keys():
+            return settings_dict[function_name]
+        file_name = os.path.join(
+            settings_dict["definitions"], settings_dict[function_name + "_hash"] + ".py"
+        )
+        if file_name not in _definition_cache.keys():
+            with open(file_name, "r") as f:
+                _definition_cache[file_name] = f.read()
+        return _definition_cache[file_name]
+
+    def to_hdf(self, status=None):
         """
         Store input, output and the class definition in an HDF5 file - to maintain orthogonal persistence.
+
+        Args:
+            status (str/ None): job status stored in the sweep catalog - by default it is 'finished' when output is
+                                available and 'initialized' otherwise.
         """
         if self._write_input_source is None:
             self._write_input_source = self._obj_to_str(self.write_input)
@@ -177,38 +727,106 @@ class SciSweeperJob(object):
             "settings": {
                 "executable": self.executable,
                 "working_directory": os.path.abspath(self._working_directory),
-                "write_input": self._write_input_source,
-                "collect_output": self._collect_output_source,
             },
         }
-        if len(self.output_dict) != 0:
-            job_dict["output"] = self.output_dict
-        h5io.write_hdf5(
-            os.path.join(self._working_directory, "scisweeper.h5"),
-            job_dict,
-            overwrite="update",
-        )
+        if self._definitions is not None:
+            job_dict["settings"]["definitions"] = self._definitions
+            job_dict["settings"]["write_input_hash"] = self._store_definition(
+                self._write_input_source
+            )
+            job_dict["settings"]["collect_output_hash"] = self._store_definition(
+                self._collect_output_source
+            )
+        else:
+            job_dict["settings"]["write_input"] = self._write_input_source
+            job_dict["settings"]["collect_output"] = self._collect_output_source
+        if self._catalog is not None:
+            job_dict["settings"]["catalog"] = self._catalog.path
+        if self._cache is not None:
+            job_dict["settings"]["cache"] = self._cache.path
+        if self._cache_key is not None:
+            job_dict["settings"]["cache_key"] = self._cache_key
+        if self._walltime is not None:
+            job_dict["settings"]["walltime"] = self._walltime
+        if self._output_storage == "native":
+            job_dict["settings"]["output_storage"] = self._output_storage
+            if self._output_compression is not None:
+                job_dict["settings"]["output_compression"] = self._output_compression
+            output_h5io_dict, output_native_dict = split_native_output(
+                output_dict=self.output_dict
+            )
+        else:
+            output_h5io_dict, output_native_dict = self.output_dict, {}
+        if len(output_h5io_dict) != 0:
+            job_dict["output"] = output_h5io_dict
+        file_name = os.path.join(self._working_directory, "scisweeper.h5")
+        h5io.write_hdf5(file_name, job_dict, overwrite="update")
+        if len(output_native_dict) != 0:
+            write_native_output(
+                file_name=file_name,
+                output_dict=output_native_dict,
+                compression=self._output_compression,
+            )
+        if self._catalog is not None:
+            if status is None:
+                if len(self.output_dict) != 0:
+                    status = "finished"
+                else:
+                    status = "initialized"
+            self._catalog.update(
+                working_directory=self._working_directory,
+                input_dict=self._input_dict,
+                output_dict=self.output_dict,
+                status=status,
+                mtime=os.path.getmtime(file_name),
+            )
 
     def from_hdf(self):
         """
-        Restore input, output and the class definition from an HDF5 file - to maintain orthogonal persistence.
+        Restore input, output and the class definition from an HDF5 file - to maintain orthogonal persistence. The
+        timing is only read from the HDF5 file on first access of the timing property.
         """
-        job_dict = h5io.read_hdf5(
-            os.path.join(self._working_directory, "scisweeper.h5")
-        )
+        file_name = os.path.join(self._working_directory, "scisweeper.h5")
+        job_dict = h5io.read_hdf5(file_name)
         if "input" in job_dict.keys():
             self.input_dict = job_dict["input"]
         if "settings" in job_dict.keys():
             self._executable = job_dict["settings"]["executable"]
             self._working_directory = job_dict["settings"]["working_directory"]
-            if "NotImplementedError" in inspect.getsource(self.write_input):
-                self._write_input_source = job_dict["settings"]["write_input"]
+            if "catalog" in job_dict["settings"].keys() and self._catalog is None:
+                self.catalog = job_dict["settings"]["catalog"]
+            if "cache" in job_dict["settings"].keys() and self._cache is None:
+                self.cache = job_dict["settings"]["cache"]
+            if "cache_key" in job_dict["settings"].keys():
+                self._cache_key = job_dict["settings"]["cache_key"]
+            if "walltime" in job_dict["settings"].keys():
+                self._walltime = job_dict["settings"]["walltime"]
+            if (
+                "definitions" in job_dict["settings"].keys()
+                and self._definitions is None
+            ):
+                self.definitions = job_dict["settings"]["definitions"]
+            if "output_storage" in job_dict["settings"].keys():
+                self._output_storage = job_dict["settings"]["output_storage"]
+                if "output_compression" in job_dict["settings"].keys():
+                    self._output_compression = job_dict["settings"][
+                        "output_compression"
+                    ]
+            if not self._is_implemented("write_input"):
+                self._write_input_source = self._load_definition(
+                    settings_dict=job_dict["settings"], function_name="write_input"
+                )
                 self.write_input = self._str_to_obj(self._write_input_source)
-            if "NotImplementedError" in inspect.getsource(self.collect_output):
-                self._collect_output_source = job_dict["settings"]["collect_output"]
+            if not self._is_implemented("collect_output"):
+                self._collect_output_source = self._load_definition(
+                    settings_dict=job_dict["settings"], function_name="collect_output"
+                )
                 self.collect_output = self._str_to_obj(self._collect_output_source)
         if "output" in job_dict.keys():
             self.output_dict = job_dict["output"]
+        if self._output_storage == "native":
+            self.output_dict.update(read_native_output(file_name=file_name))
+        self._timing = None
 
     def run(self, run_again=False):
         """
@@ -227,90 +845,349 @@ class SciSweeperJob(object):
             or run_again
         ):
             if self._pysqa is None:
-                self.write_input(
-                    input_dict=self.input_dict,
-                    working_directory=self._working_directory,
-                )
-                if self._executable is None:
-                    self._executable = self.executable
-                subprocess.check_output(
-                    self._executable,
-                    cwd=self._working_directory,
-                    universal_newlines=True,
-                    shell=True,
-                )
-                self.output_dict = self.collect_output(
-                    working_directory=self._working_directory
-                )
-                self.to_hdf()
+                self._emit(event="started")
+                try:
+                    self._run_local()
+                except Exception as e:
+                    self._record_error(exception=e)
+                    self._emit(event="failed")
+                    raise
+                self._clear_error()
+                self._emit(event="finished")
             else:
-                self.to_hdf()
+                self.to_hdf(status="submitted")
                 return self._pysqa.submit_job(
                     command="python -m scisweeper.cli -p " + self._working_directory,
                     working_directory=self._working_directory,
                     job_name=os.path.basename(self._working_directory),
                     cores=self.cores,
                 )
+        elif self._pysqa is None:
+            self._emit(event="skipped")
 
-    def run_broken_again(self):
+    def _run_local(self):
         """
-        Recalcualte the job if it has no information stored in the output dictionary - this commonly means the
-        calculation failed previously.
+        Internal helper function to execute the calculation locally and record the timing of the individual phases.
         """
-        self.from_hdf()
-        self.output_dict = self.collect_output(
-            working_directory=self._working_directory
-        )
-        if len(self.output_dict) == 0:
-            self.run()
+        timer = PhaseTimer()
+        if not self._load_from_cache():
+            start_time = time.time()
+            with timer.measure("write_input"):
+                self.write_input(
+                    input_dict=self.input_dict,
+                    working_directory=self._working_directory,
+                )
+            self._emit(event="input_written")
+            if self._executable is None:
+                self._executable = self.executable
+            timer.run_executable(
+                executable=self._executable, working_directory=self._working_directory
+            )
+            self._emit(event="executable_finished")
+            with timer.measure("collect_output"):
+                self.output_dict = self.collect_output(
+                    working_directory=self._working_directory
+                )
+            self._emit(event="output_collected")
+            self._walltime = time.time() - start_time
+            self._store_in_cache()
+        with timer.measure("to_hdf"):
+            self.to_hdf()
+        self._write_timing(timing_dict=timer.timing_dict)
 
-    def run_collect_output(self):
+    @property
+    def _error_file(self):
+        return os.path.join(self._working_directory, "scisweeper_error.json")
+
+    def _record_error(self, exception):
         """
-        Parse the output files again without executing the calculation again. Use this function after updating the
-        collect_output function.
+        Internal helper function to store the exception, the exit code and the tail of the standard error of a failed
+        calculation in scisweeper_error.json in the working directory and mark the job as failed in the catalog.
+
+        Args:
+            exception (Exception): exception raised by the calculation
         """
-        self.from_hdf()
-        self.output_dict = self.collect_output(
-            working_directory=self._working_directory
-        )
-        self.to_hdf()
+        self._error = get_error_dict(exception=exception)
+        with open(self._error_file, "w") as f:
+            json.dump(self._error, f)
+        if self._catalog is not None:
+            file_name = os.path.join(self._working_directory, "scisweeper.h5")
+            if os.path.exists(file_name):
+                mtime = os.path.getmtime(file_name)
+            else:
+                mtime = None
+            self._catalog.update(
+                working_directory=self._working_directory,
+                input_dict=self._input_dict,
+                output_dict={},
+                status="failed",
+                mtime=mtime,
+            )
 
+    def _clear_error(self):
+        """
+        Internal helper function to remove the error of a previous failed execution.
+        """
+        self._error = None
+        if os.path.exists(self._error_file):
+            os.remove(self._error_file)
 
-class SciSweeper(object):
-    def __init__(
-        self, working_directory=".", job_class=None, cores=1, pysqa_config=None
-    ):
-        self.working_directory = os.path.abspath(working_directory)
-        if sys.version_info[0] >= 3:
-            os.makedirs(self.working_directory, exist_ok=True)
-        else:
-            if not os.path.exists(self.working_directory):
-                os.makedirs(self.working_directory)
-        self._fileindex = PyFileIndex(
-            path=self.working_directory, filter_function=filter_function
-        )
-        self._job_class = job_class
-        self._results_df = None
-        self._broken_jobs = []
-        self._cores = cores
-        self._job_name_function = None
-        self.job = SciSweeperJob
-        self._pysqa = None
-        self.pysqa = pysqa_config
-        self._job_id_lst = []
+    def read_error(self):
+        """
+        Read the error of the last failed execution of the calculation.
 
-    @property
-    def pysqa(self):
-        return self._pysqa
+        Returns:
+            dict/ None: exception, exit code, tail of the standard error and traceback - None if the job did not fail
+        """
+        if os.path.exists(self._error_file):
+            with open(self._error_file, "r") as f:
+                self._error = json.load(f)
+        return self._error
 
-    @pysqa.setter
-    def pysqa(self, pysqa_config):
-        if isinstance(pysqa_config, str):
-            self._pysqa = QueueAdapter(pysqa_config)
-        else:
-            self._pysqa = pysqa_config
+    def _emit(self, event):
+        """
+        Internal helper function to pass an event of the job to the event callback of the sweep.
 
-    @property
+        Args:
+            event (str): 'started', 'input_written', 'executable_finished', 'output_collected', 'finished', 'failed' or
+                         'skipped'
+        """
+        if self._event_callback is not None:
+            self._event_callback(
+                event=event,
+                job_name=os.path.basename(self._working_directory),
+                timestamp=time.time(),
+            )
+
+    def get_cache_key(self):
+        """
+        Get the key of the job in the result cache - the hash of the input dictionary, the executable and the source
+        code of the write_input and collect_output functions.
+
+        Returns:
+            str: SHA1 hash
+        """
+        if self._write_input_source is None:
+            self._write_input_source = self._obj_to_str(self.write_input)
+        if self._collect_output_source is None:
+            self._collect_output_source = self._obj_to_str(self.collect_output)
+        return hashlib.sha1(
+            json.dumps(
+                _get_hashable(
+                    [
+                        self._input_dict,
+                        self.executable,
+                        self._write_input_source,
+                        self._collect_output_source,
+                    ]
+                ),
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _write_timing(self, timing_dict):
+        """
+        Internal helper function to store the per phase timing in the HDF5 file.
+
+        Args:
+            timing_dict (dict): walltime, CPU time and peak RSS of the individual phases
+        """
+        self._timing = timing_dict
+        file_name = os.path.join(self._working_directory, "scisweeper.h5")
+        write_timing(file_name=file_name, timing_dict=timing_dict)
+        if self._catalog is not None:
+            self._catalog.update_mtime(
+                working_directory=self._working_directory,
+                mtime=os.path.getmtime(file_name),
+            )
+
+    def _load_from_cache(self):
+        """
+        Internal helper function to restore the output from the result cache. The cache key of a restored job is
+        stored in the settings, as the working directory of the job contains no output files.
+
+        Returns:
+            bool: True if the output was found in the cache
+        """
+        self._cache_key = None
+        if self._cache is None:
+            return False
+        cache_key = self.get_cache_key()
+        output_dict = self._cache.load(key=cache_key)
+        if output_dict is None:
+            return False
+        self.output_dict = output_dict
+        self._cache_key = cache_key
+        return True
+
+    def _store_in_cache(self):
+        """
+        Internal helper function to store the output in the result cache.
+        """
+        if self._cache is not None and len(self.output_dict) != 0:
+            self._cache.store(key=self.get_cache_key(), output_dict=self.output_dict)
+
+    def run_async(self, run_again=False):
+        """
+        Execute the calculation on the asyncio event loop - use 'await job.run_async()' inside a running event loop.
+
+        Args:
+            run_again (bool): If the calculation already exists it is commonly skipped, but with this option
+                              you can force to execute the calculation again.
+
+        Returns:
+            coroutine: awaitable returning the queue id if the job is submitted to a queuing system, else None.
+        """
+        from .asyncio_engine import run_job_async
+
+        return run_job_async(job=self, run_again=run_again)
+
+    def run_broken_again(self):
+        """
+        Recalcualte the job if it has no information stored in the output dictionary - this commonly means the
+        calculation failed previously. Jobs restored from the result cache have no output files, their output is
+        taken from the HDF5 file instead.
+        """
+        self.from_hdf()
+        if self._cache_key is None:
+            self.output_dict = self.collect_output(
+                working_directory=self._working_directory
+            )
+        if len(self.output_dict) == 0:
+            self.run()
+
+    def run_collect_output(self):
+        """
+        Parse the output files again without executing the calculation again. Use this function after updating the
+        collect_output function. Jobs restored from the result cache have no output files, so they are executed again
+        instead - the updated collect_output function changes the cache key, so the output is only restored from the
+        cache if it was calculated with the same collect_output function.
+        """
+        self.from_hdf()
+        if self._cache_key is not None:
+            self.run(run_again=True)
+        else:
+            self.output_dict = self.collect_output(
+                working_directory=self._working_directory
+            )
+            self.to_hdf()
+
+
+class SciSweeper(object):
+    def __init__(
+        self,
+        working_directory=".",
+        job_class=None,
+        cores=1,
+        pysqa_config=None,
+        catalog=False,
+        definitions=False,
+        output_storage="h5io",
+        output_compression=None,
+        cache=None,
+    ):
+        self.working_directory = os.path.abspath(working_directory)
+        os.makedirs(self.working_directory, exist_ok=True)
+        from pyfileindex import PyFileIndex
+
+        self._fileindex = PyFileIndex(
+            path=self.working_directory, filter_function=filter_function
+        )
+        self._job_class = job_class
+        self._results_df = None
+        self._broken_jobs = []
+        self._cores = cores
+        self._job_name_function = None
+        self.job = SciSweeperJob
+        self._pysqa = None
+        self.pysqa = pysqa_config
+        self._job_id_lst = []
+        self._catalog = None
+        self.catalog = catalog
+        self._definitions = None
+        self.definitions = definitions
+        self._output_storage = output_storage
+        self._output_compression = output_compression
+        self._cache = None
+        self.cache = cache
+        self._subscriber_lst = []
+        self._failed_jobs = {}
+
+    @property
+    def pysqa(self):
+        return self._pysqa
+
+    @pysqa.setter
+    def pysqa(self, pysqa_config):
+        if isinstance(pysqa_config, str):
+            from pysqa import QueueAdapter
+
+            self._pysqa = QueueAdapter(pysqa_config)
+        else:
+            self._pysqa = pysqa_config
+
+    @property
+    def catalog(self):
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, catalog):
+        if isinstance(catalog, str):
+            from .catalog import SciSweeperCatalog
+
+            self._catalog = SciSweeperCatalog(catalog)
+        elif isinstance(catalog, bool):
+            if catalog:
+                from .catalog import SciSweeperCatalog
+
+                self._catalog = SciSweeperCatalog(
+                    os.path.join(self.working_directory, "scisweeper.db")
+                )
+            else:
+                self._catalog = None
+        else:
+            self._catalog = catalog
+
+    @property
+    def definitions(self):
+        return self._definitions
+
+    @definitions.setter
+    def definitions(self, definitions):
+        if isinstance(definitions, str):
+            self._definitions = os.path.abspath(definitions)
+        elif definitions:
+            self._definitions = os.path.join(
+                self.working_directory, "scisweeper_definitions"
+            )
+        else:
+            self._definitions = None
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        if isinstance(cache, str):
+            from .cache import SciSweeperCache
+
+            self._cache = SciSweeperCache(cache)
+        else:
+            self._cache = cache
+
+    @property
+    def _job_kwargs(self):
+        return {
+            "catalog": self._catalog,
+            "definitions": self._definitions,
+            "output_storage": self._output_storage,
+            "output_compression": self._output_compression,
+            "cache": self._cache,
+        }
+
+    @property
     def cores(self):
         return self._cores
 
@@ -342,26 +1219,170 @@ class SciSweeper(object):
     def broken_jobs(self):
         return self._broken_jobs
 
-    def collect(self):
+    @property
+    def failed_jobs(self):
+        return self._failed_jobs
+
+    def collect(
+        self,
+        incremental=False,
+        cores=1,
+        columns=None,
+        input_columns=None,
+        output_columns=None,
+        compact=False,
+        timing=False,
+    ):
         """
         Check status of the calculations and update the results table.
+
+        Args:
+            incremental (bool): Only read the jobs whose scisweeper.h5 file was created or modified since the last
+                                incremental collect and reuse the previous results - stored in scisweeper_results.pkl -
+                                for all other jobs.
+            cores (int): number of worker processes to read the HDF5 files concurrently.
+            columns (list/ None): only read the given input and output keys from the HDF5 files, skipping the settings
+                                  and the stored function source code.
+            input_columns (list/ None): only read the given input keys - overrides columns for the input.
+            output_columns (list/ None): only read the given output keys - overrides columns for the output. A job is
+                                         considered broken when one of the selected output keys is missing.
+            compact (bool): Store the results table memory compact - numeric dtypes, equal length arrays as rows of a
+                            contiguous 2D numpy array, categoricals for repeated strings and sparse columns for rarely
+                            present numeric keys.
+            timing (bool): add the walltime and CPU time of the phases write_input, executable, collect_output and
+                           to_hdf as columns <phase>_walltime and <phase>_cputime and the peak RSS of the executable
+                           as column executable_maxrss.
         """
+        if input_columns is None:
+            input_columns = columns
+        if output_columns is None:
+            output_columns = columns
+        if incremental and (input_columns is not None or output_columns is not None):
+            raise ValueError("The incremental collect requires all columns to be read.")
         self._fileindex.update()
-        dict_lst, broken_jobs = self._check_jobs()
-        self._results_df = pandas.DataFrame(dict_lst)
-        self._broken_jobs = (
-            np.array(
-                [
-                    self._fileindex.dataframe[
-                        (~self._fileindex.dataframe.is_directory)
-                        & self._fileindex.dataframe.path.str.contains("/" + s + "/")
-                    ].dirname.values
-                    for s in broken_jobs
-                ]
+        self._results_df, broken_jobs = self._check_jobs(
+            incremental=incremental,
+            cores=cores,
+            input_key_lst=input_columns,
+            output_key_lst=output_columns,
+            compact=compact,
+        )
+        job_directory_dict = {}
+        for path in self._fileindex.dataframe[
+            ~self._fileindex.dataframe.is_directory
+        ].dirname.values:
+            job_directory_dict.setdefault(os.path.basename(path), []).append(path)
+        self._broken_jobs = [
+            path for s in broken_jobs for path in job_directory_dict.get(s, [])
+        ]
+        if timing and len(self._results_df) > 0:
+            self._results_df = self._results_df.merge(
+                self._read_timing(cores=cores), on="dir", how="left"
+            )
+
+    def get_timing_summary(self, cores=1):
+        """
+        Summarize the per phase timing of all jobs of the sweep, to identify whether the sweep is bound by the
+        simulation, by parsing the output or by the HDF5 I/O.
+
+        Args:
+            cores (int): number of worker processes to read the HDF5 files concurrently.
+
+        Returns:
+            pandas.DataFrame: total, mean and maximum walltime, total CPU time, maximum peak RSS of the
+                              executable in kilobytes and the fraction of the total walltime for each phase
+        """
+        import pandas
+
+        timing_df = self._read_timing(cores=cores)
+        summary_lst = []
+        for phase in phase_lst:
+            if phase + "_walltime" not in timing_df.columns:
+                continue
+            walltime = timing_df[phase + "_walltime"]
+            summary_dict = {
+                "phase": phase,
+                "jobs": int(walltime.count()),
+                "walltime": walltime.sum(),
+                "walltime_mean": walltime.mean(),
+                "walltime_max": walltime.max(),
+            }
+            if phase + "_cputime" in timing_df.columns:
+                summary_dict["cputime"] = timing_df[phase + "_cputime"].sum()
+            if phase + "_maxrss" in timing_df.columns:
+                summary_dict["maxrss"] = timing_df[phase + "_maxrss"].max()
+            summary_lst.append(summary_dict)
+        summary_df = pandas.DataFrame(summary_lst)
+        if len(summary_df) > 0:
+            summary_df["fraction"] = summary_df.walltime / summary_df.walltime.sum()
+            summary_df = summary_df.set_index("phase")
+        return summary_df
+
+    def _read_timing(self, cores=1):
+        """
+        Internal helper function to read the per phase timing of all jobs.
+
+        Args:
+            cores (int): number of worker processes to read the HDF5 files concurrently.
+
+        Returns:
+            pandas.DataFrame: timing table with the job name in the 'dir' column
+        """
+        import pandas
+
+        path_lst = list(
+            self._fileindex.dataframe[
+                ~self._fileindex.dataframe.is_directory
+            ].dirname.values
+        )
+        timing_df = pandas.DataFrame(
+            map_parallel(
+                function=read_timing_parallel, argument_lst=path_lst, cores=cores
             )
-            .flatten()
-            .tolist()
         )
+        timing_df["dir"] = [os.path.basename(path) for path in path_lst]
+        return timing_df
+
+    def iter_results(self, chunk_size=1000, columns=None, cores=1):
+        """
+        Iterate over the results table in chunks of chunk_size jobs, so sweeps which do not fit in memory can be
+        reduced or written out chunk by chunk. Missing keys are only filled with NaN within each chunk.
+
+        Args:
+            chunk_size (int): number of jobs per chunk
+            columns (list/ None): input and output keys to include - the 'dir' column is always included
+            cores (int): number of worker processes to read the HDF5 files concurrently
+
+        Yields:
+            pandas.DataFrame: results table of the jobs in the current chunk
+        """
+        self._fileindex.update()
+        df_files = self._fileindex.dataframe[~self._fileindex.dataframe.is_directory]
+        path_lst = list(df_files.dirname.values)
+        mtime_dict = dict(zip(df_files.dirname.values, df_files.mtime.values))
+        for i in range(0, len(path_lst), chunk_size):
+            path_chunk_lst = path_lst[i : i + chunk_size]
+            if self._catalog is not None:
+                catalog_dict = self._catalog.read(
+                    path_lst=path_chunk_lst, mtime_dict=mtime_dict
+                )
+            else:
+                catalog_dict = {}
+            yield self._assemble_results(
+                job_lst=[
+                    (os.path.basename(path), input_dict, output_dict)
+                    for path, (input_dict, output_dict) in zip(
+                        path_chunk_lst,
+                        self._read_jobs(
+                            path_lst=path_chunk_lst,
+                            catalog_dict=catalog_dict,
+                            cores=cores,
+                            input_key_lst=columns,
+                            output_key_lst=columns,
+                        ),
+                    )
+                ]
+            )[0]
 
     def delete_jobs_from_queue(self):
         """
@@ -378,6 +1399,8 @@ class SciSweeper(object):
             pandas.Dataframe/ None: Status table
         """
         if self._pysqa is not None:
+            import pandas
+
             status_lst = self.pysqa.get_status_of_jobs(
                 process_id_lst=[j[0] for j in self._job_id_lst]
             )
@@ -388,37 +1411,192 @@ class SciSweeper(object):
                 ]
             )
 
-    def run_jobs_in_parallel(self, input_dict_lst, cores=None, job_name_function=None):
+    def run_jobs_in_parallel(
+        self,
+        input_dict_lst,
+        cores=None,
+        job_name_function=None,
+        backend="thread",
+        bundle_size=None,
+        bundle_cores=1,
+        pilot_workers=None,
+        max_pending=None,
+        longest_first=False,
+        cost_function=None,
+        retries=0,
+        retry_backoff=1.0,
+        retry_on=None,
+        fail_fast=None,
+        fail_fast_window=20,
+    ):
         """
-        Execute multiple SciSweeperJobs in parallel using multiprocessing.ThreadPool
+        Execute multiple SciSweeperJobs in parallel using a thread pool, a process pool or a user defined executor
 
         Args:
-            input_dict_lst (list): List of dictionaries with input parametern
+            input_dict_lst (list/ iterable): List of dictionaries with input parametern - any iterable, like the
+                                             generators in scisweeper.parameters, is consumed lazily.
             cores (int/ None): number of cores to use = number of parallel threads.
             job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
                                                 job_name as string. This can be defined by the user to have recognizable
                                                 job names.
+            backend (str/ concurrent.futures.Executor): 'thread' for a multiprocessing.ThreadPool, 'process' for a
+                                                        multiprocessing.Pool, 'asyncio' for the asyncio engine or any
+                                                        concurrent.futures.Executor. For the process backends the job
+                                                        class and the input dictionaries are pickled, so the job class
+                                                        has to be importable.
+            bundle_size (int/ None): When a queuing system is used, submit bundles of bundle_size jobs as a single
+                                     queuing system job instead of one queuing system job per calculation.
+            bundle_cores (int): number of jobs of a bundle or a pilot worker which are executed in parallel - each
+                                queuing system job requests cores * bundle_cores cores.
+            pilot_workers (int/ None): When a queuing system is used, store all jobs and submit pilot_workers long
+                                       running queuing system jobs, which claim and execute the jobs of the sweep until
+                                       it is drained. Can not be combined with bundle_size. Claims do not expire, so
+                                       jobs which failed or whose pilot worker was killed are not executed again by
+                                       the pilot workers until their scisweeper.claim file is removed.
+            max_pending (int/ None): maximum number of jobs submitted to the pool or executor which are not finished
+                                     yet - the input is only consumed when one of the submitted jobs finished, so the
+                                     memory usage does not depend on the number of jobs. Defaults to 4 * cores, values
+                                     below cores are raised to cores. The asyncio backend takes the jobs from the input
+                                     in cores worker coroutines, so there at most cores jobs are pending.
+            longest_first (bool): execute the jobs with the longest expected walltime first to minimize the total
+                                  walltime of the sweep - this requires the whole input_dict_lst in memory.
+            cost_function (function/ None): Function which takes the input_dict as input to return the expected
+                                            walltime. By default a RuntimeModel is fitted to the walltimes recorded in
+                                            the manifest.
+            retries (int): number of times a failed job is executed again, for transient failures.
+            retry_backoff (float): waiting time in seconds before the first retry, doubled for every further retry.
+            retry_on (tuple/ None): only retry for these exception classes, like (subprocess.CalledProcessError, ) -
+                                    all exceptions for None.
+            fail_fast (float/ None): stop submitting new jobs when the fraction of failed jobs among the last
+                                     fail_fast_window finished jobs reaches this threshold - the running jobs are
+                                     completed and a RuntimeError is raised.
+            fail_fast_window (int): number of finished jobs the failure rate for fail_fast is calculated for.
+
+        The errors of the failed jobs - exception, exit code, tail of the standard error and traceback - are stored in
+        scisweeper_error.json in the working directory of the job and are available in SciSweeper.failed_jobs.
+
+        When a result cache is set, jobs with the same cache key as a previous job in input_dict_lst are executed after
+        the other jobs finished, so they are restored from the cache rather than being calculated twice.
+
+        Locally executed jobs are recorded as finished or failed in the manifest of the sweep. When the sweep is
+        restarted, the jobs which are listed as finished are skipped without accessing their working directories.
         """
+        if bundle_size is not None and pilot_workers is not None:
+            raise ValueError(
+                "The options bundle_size and pilot_workers can not be combined, as the jobs of the bundles are not "
+                "claimed and would be executed by the pilot workers at the same time."
+            )
         if cores is None:
             cores = self._cores
         if job_name_function is None:
             job_name_function = self.job_name_function
-        if self._pysqa is None:
-            tp = ThreadPool(cores)
-        else:
-            tp = None
-        for counter, input_dict in enumerate(tqdm(input_dict_lst)):
-            if job_name_function is not None:
-                job_name = job_name_function(input_dict=input_dict, counter=counter)
-                working_directory = os.path.abspath(
-                    os.path.join(self.working_directory, job_name)
+        if self._pysqa is None and backend == "asyncio":
+            import asyncio
+
+            asyncio.run(
+                self.run_jobs_async(
+                    input_dict_lst=input_dict_lst,
+                    cores=cores,
+                    job_name_function=job_name_function,
+                    longest_first=longest_first,
+                    cost_function=cost_function,
+                    retries=retries,
+                    retry_backoff=retry_backoff,
+                    retry_on=retry_on,
+                    fail_fast=fail_fast,
+                    fail_fast_window=fail_fast_window,
                 )
+            )
+            return
+        if max_pending is None:
+            max_pending = 4 * cores
+        else:
+            max_pending = max(max_pending, cores)
+        from tqdm import tqdm
+
+        tp, bundle_lst, duplicate_lst, key_set = None, [], [], set()
+        manifest = self._manifest
+        monitor = SweepMonitor(
+            manifest=manifest,
+            fail_fast=fail_fast,
+            fail_fast_window=fail_fast_window,
+            max_pending=max_pending,
+        )
+        job_kwargs = self._get_event_job_kwargs(backend=backend)
+        if self._pysqa is None and isinstance(backend, str):
+            if backend == "thread":
+                tp = ThreadPool(cores)
+            elif backend == "process":
+                tp = Pool(cores)
             else:
-                working_directory = os.path.abspath(
-                    os.path.join(self.working_directory, "job_" + str(counter))
+                raise ValueError(
+                    "The backend has to be 'thread', 'process', 'asyncio' or a concurrent.futures.Executor."
                 )
+        for working_directory, input_dict in tqdm(
+            self._get_pending_jobs(
+                input_dict_lst=input_dict_lst,
+                manifest=manifest,
+                job_name_function=job_name_function,
+                longest_first=longest_first,
+                cost_function=cost_function,
+            )
+        ):
+            job_name = os.path.basename(working_directory)
             if self._pysqa is None:
-                tp.apply_async(run_parallel, (self, working_directory, input_dict))
+                arguments = (
+                    self._job_class,
+                    job_kwargs,
+                    working_directory,
+                    input_dict,
+                    retries,
+                    retry_backoff,
+                    retry_on,
+                )
+                if self._cache is not None:
+                    key = self.job_class(
+                        working_directory=working_directory,
+                        input_dict=input_dict,
+                        **self._job_kwargs
+                    ).get_cache_key()
+                    if key in key_set:
+                        duplicate_lst.append((job_name, arguments))
+                        continue
+                    key_set.add(key)
+                monitor.acquire_slot()
+                if monitor.fail_fast_triggered():
+                    monitor.release_slot()
+                    monitor.stopped = True
+                    break
+                if "event_callback" in job_kwargs.keys():
+                    self._emit_event(event="queued", job_name=job_name)
+                if tp is not None:
+                    tp.apply_async(
+                        run_parallel,
+                        arguments,
+                        callback=partial(monitor.callback, job_name),
+                        error_callback=partial(monitor.error_callback, job_name),
+                    )
+                else:
+                    backend.submit(run_parallel, *arguments).add_done_callback(
+                        partial(monitor.future_callback, job_name)
+                    )
+            elif bundle_size is not None or pilot_workers is not None:
+                job = self.job_class(
+                    working_directory=working_directory,
+                    input_dict=input_dict,
+                    cores=cores,
+                    **self._job_kwargs
+                )
+                if not os.path.exists(os.path.join(working_directory, "scisweeper.h5")):
+                    job.to_hdf(status="submitted")
+                    bundle_lst.append(working_directory)
+                if bundle_size is not None and len(bundle_lst) == bundle_size:
+                    self._submit_bundle(
+                        working_directory_lst=bundle_lst,
+                        cores=cores,
+                        bundle_cores=bundle_cores,
+                    )
+                    bundle_lst = []
             else:
                 self._job_id_lst.append(
                     [
@@ -427,13 +1605,209 @@ class SciSweeper(object):
                             input_dict=input_dict,
                             pysqa_config=self.pysqa,
                             cores=cores,
+                            **self._job_kwargs
                         ).run(),
                         os.path.basename(working_directory),
                     ]
                 )
-        if self._pysqa is None:
+        if pilot_workers is not None and self._pysqa is not None:
+            self._submit_workers(
+                pilot_workers=pilot_workers, cores=cores, bundle_cores=bundle_cores
+            )
+        elif len(bundle_lst) > 0:
+            self._submit_bundle(
+                working_directory_lst=bundle_lst,
+                cores=cores,
+                bundle_cores=bundle_cores,
+            )
+        if tp is not None:
             tp.close()
             tp.join()
+        elif self._pysqa is None:
+            monitor.wait()
+        for job_name, arguments in duplicate_lst:
+            if monitor.stopped:
+                break
+            try:
+                walltime = run_parallel(*arguments)
+            except Exception as e:
+                monitor.record_failed(job_name=job_name, exception=e)
+            else:
+                monitor.record_finished(job_name=job_name, walltime=walltime)
+        self._finish_sweep(
+            monitor=monitor, fail_fast=fail_fast, fail_fast_window=fail_fast_window
+        )
+
+    def _finish_sweep(self, monitor, fail_fast=None, fail_fast_window=20):
+        """
+        Internal helper function to store the errors of the failed jobs of a sweep and report them.
+
+        Args:
+            monitor (SweepMonitor): monitor of the sweep
+            fail_fast (float/ None): fail fast threshold of the sweep
+            fail_fast_window (int): number of finished jobs the failure rate for fail_fast is calculated for
+        """
+        self._failed_jobs = monitor.failed_dict
+        if monitor.stopped:
+            raise RuntimeError(
+                "Stopped submitting jobs as the failure rate of the last "
+                + str(fail_fast_window)
+                + " jobs reached "
+                + str(fail_fast)
+                + " - see SciSweeper.failed_jobs."
+            )
+        elif len(self._failed_jobs) > 0:
+            warnings.warn(
+                str(len(self._failed_jobs))
+                + " jobs failed - see SciSweeper.failed_jobs."
+            )
+
+    def run_jobs_async(
+        self,
+        input_dict_lst,
+        cores=None,
+        job_name_function=None,
+        longest_first=False,
+        cost_function=None,
+        retries=0,
+        retry_backoff=1.0,
+        retry_on=None,
+        fail_fast=None,
+        fail_fast_window=20,
+    ):
+        """
+        Execute multiple SciSweeperJobs on the asyncio event loop - use 'await ssw.run_jobs_async(...)' inside a
+        running event loop, for example in a Jupyter notebook, to keep it responsive while the sweep is running.
+        A failing job does not stop the other jobs, the errors of the failed jobs are available in
+        SciSweeper.failed_jobs after the sweep.
+
+        Args:
+            input_dict_lst (list/ iterable): List of dictionaries with input parametern, consumed lazily.
+            cores (int/ None): maximum number of concurrently running jobs.
+            job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
+                                                job_name as string.
+            longest_first (bool): execute the jobs with the longest expected walltime first.
+            cost_function (function/ None): Function which takes the input_dict as input to return the expected
+                                            walltime.
+            retries (int): number of times a failed job is executed again, for transient failures.
+            retry_backoff (float): waiting time in seconds before the first retry, doubled for every further retry.
+            retry_on (tuple/ None): only retry for these exception classes - all exceptions for None.
+            fail_fast (float/ None): stop starting new jobs when the fraction of failed jobs among the last
+                                     fail_fast_window finished jobs reaches this threshold - the running jobs are
+                                     completed and a RuntimeError is raised.
+            fail_fast_window (int): number of finished jobs the failure rate for fail_fast is calculated for.
+
+        Returns:
+            coroutine: awaitable returning the list of return values of the successful jobs
+        """
+        from .asyncio_engine import run_jobs_async
+
+        if cores is None:
+            cores = self._cores
+        if job_name_function is None:
+            job_name_function = self.job_name_function
+        manifest = self._manifest
+        if self._pysqa is None:
+            monitor = SweepMonitor(
+                manifest=manifest,
+                fail_fast=fail_fast,
+                fail_fast_window=fail_fast_window,
+            )
+            finish_function = partial(
+                self._finish_sweep,
+                monitor=monitor,
+                fail_fast=fail_fast,
+                fail_fast_window=fail_fast_window,
+            )
+        else:
+            monitor, finish_function = None, None
+        job_kwargs = self._get_event_job_kwargs(backend="asyncio")
+        return run_jobs_async(
+            job_lst=(
+                self._job_class(
+                    working_directory=working_directory,
+                    input_dict=input_dict,
+                    pysqa_config=self.pysqa,
+                    cores=cores,
+                    **job_kwargs
+                )
+                for working_directory, input_dict in self._get_pending_jobs(
+                    input_dict_lst=input_dict_lst,
+                    manifest=manifest,
+                    job_name_function=job_name_function,
+                    longest_first=longest_first,
+                    cost_function=cost_function,
+                )
+            ),
+            cores=cores,
+            monitor=monitor,
+            retries=retries,
+            retry_backoff=retry_backoff,
+            retry_on=retry_on,
+            finish_function=finish_function,
+        )
+
+    def run_adaptive(self, strategy, budget, cores=None, job_name_function=None):
+        """
+        Execute an adaptive sweep - the strategy proposes the initial batch of input dictionaries and whenever a job
+        finishes it is asked for new input dictionaries based on the output of the finished jobs, so all cores stay
+        busy. The sweep stops when the budget is used up or the strategy does not propose any new points, for example
+        because the tolerance is reached.
+
+        Args:
+            strategy (scisweeper.adaptive.AdaptiveStrategy): sampling strategy like BisectionStrategy or
+                                                             RefinementStrategy
+            budget (int): maximum number of jobs
+            cores (int/ None): number of jobs executed in parallel
+            job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
+                                                job_name as string.
+
+        Returns:
+            list: list of (input_dict, output_dict) tuples of the finished jobs
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        if self._pysqa is not None:
+            raise ValueError(
+                "Adaptive sweeps require the output of the previous jobs and are only executed locally."
+            )
+        if cores is None:
+            cores = self._cores
+        if job_name_function is None:
+            job_name_function = self.job_name_function
+        result_lst, pending_dict, counter, job_index = [], {}, 0, 0
+        with ThreadPoolExecutor(max_workers=cores) as executor:
+            while True:
+                if counter < budget:
+                    for input_dict in strategy.ask(
+                        n=max(cores - len(pending_dict), 0),
+                        result_lst=result_lst,
+                        pending_lst=list(pending_dict.values()),
+                    )[: budget - counter]:
+                        working_directory, job_index = self._get_free_working_directory(
+                            input_dict=input_dict,
+                            counter=job_index,
+                            job_name_function=job_name_function,
+                        )
+                        future = executor.submit(
+                            run_adaptive_job,
+                            self._job_class,
+                            self._job_kwargs,
+                            working_directory,
+                            input_dict,
+                        )
+                        pending_dict[future] = input_dict
+                        counter += 1
+                        job_index += 1
+                if len(pending_dict) == 0:
+                    break
+                done_lst, _ = wait(
+                    list(pending_dict.keys()), return_when=FIRST_COMPLETED
+                )
+                for future in done_lst:
+                    del pending_dict[future]
+                    result_lst.append(future.result())
+        return result_lst
 
     def run_job(self, job_working_directory, input_dict):
         """
@@ -450,49 +1824,452 @@ class SciSweeper(object):
             working_directory=job_working_directory,
             input_dict=input_dict,
             pysqa_config=self.pysqa,
+            **self._job_kwargs
         ).run()
 
-    def run_collect_output(self):
+    def run_collect_output(self, cores=1):
         """
         For each job in this directory and all sub directories collect the output again. Use this function after
-        updating the collect_output function.
+        updating the collect_output function. Jobs restored from the result cache have no output files, so they are
+        executed again instead.
+
+        Args:
+            cores (int): number of worker processes to collect the output concurrently.
         """
-        for path in tqdm(
-            self._fileindex.dataframe[
-                ~self._fileindex.dataframe.is_directory
-            ].dirname.values
+        map_parallel(
+            function=partial(
+                collect_output_parallel, self._job_class, self._job_kwargs
+            ),
+            argument_lst=list(
+                self._fileindex.dataframe[
+                    ~self._fileindex.dataframe.is_directory
+                ].dirname.values
+            ),
+            cores=cores,
+        )
+        self.collect(cores=cores)
+
+    def _submit_bundle(self, working_directory_lst, cores=1, bundle_cores=1):
+        """
+        Internal helper function to submit a bundle of jobs as a single job to the queuing system. The list of working
+        directories is stored in the bundle.txt file of the bundle directory in the root of the sweep.
+
+        Args:
+            working_directory_lst (list): list of working directories of the jobs in the bundle
+            cores (int): number of cores per job
+            bundle_cores (int): number of jobs of the bundle which are executed in parallel
+        """
+        bundle_name = "scisweeper_bundle_" + os.path.basename(working_directory_lst[0])
+        bundle_directory = os.path.join(self.working_directory, bundle_name)
+        os.makedirs(bundle_directory, exist_ok=True)
+        bundle_file = os.path.join(bundle_directory, "bundle.txt")
+        with open(bundle_file, "w") as f:
+            f.writelines([path + "\n" for path in working_directory_lst])
+        self._job_id_lst.append(
+            [
+                self._pysqa.submit_job(
+                    command="python -m scisweeper.cli -b "
+                    + bundle_file
+                    + " -c "
+                    + str(bundle_cores),
+                    working_directory=bundle_directory,
+                    job_name=bundle_name,
+                    cores=cores * bundle_cores,
+                ),
+                bundle_name,
+            ]
+        )
+
+    def _submit_workers(self, pilot_workers, cores=1, bundle_cores=1):
+        """
+        Internal helper function to submit pilot workers to the queuing system.
+
+        Args:
+            pilot_workers (int): number of pilot workers
+            cores (int): number of cores per job
+            bundle_cores (int): number of jobs each pilot worker executes in parallel
+        """
+        for i in range(pilot_workers):
+            worker_name = "scisweeper_worker_" + str(i)
+            worker_directory = os.path.join(self.working_directory, worker_name)
+            os.makedirs(worker_directory, exist_ok=True)
+            self._job_id_lst.append(
+                [
+                    self._pysqa.submit_job(
+                        command="python -m scisweeper.cli -w "
+                        + self.working_directory
+                        + " -c "
+                        + str(bundle_cores),
+                        working_directory=worker_directory,
+                        job_name=worker_name,
+                        cores=cores * bundle_cores,
+                    ),
+                    worker_name,
+                ]
+            )
+
+    def _get_working_directory(self, input_dict, counter, job_name_function=None):
+        """
+        Internal helper function to get the working directory of an individual job.
+
+        Args:
+            input_dict (dict): Dictionary with input parameters
+            counter (int): index of the job in the sweep
+            job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
+                                                job_name as string.
+
+        Returns:
+            str: absolute path of the working directory
+        """
+        if job_name_function is not None:
+            job_name = job_name_function(input_dict=input_dict, counter=counter)
+        else:
+            job_name = "job_" + str(counter)
+        return os.path.abspath(os.path.join(self.working_directory, job_name))
+
+    def _get_free_working_directory(self, input_dict, counter, job_name_function=None):
+        """
+        Internal helper function to get the working directory of a new job, skipping the job names of the jobs which
+        were already executed in the sweep directory.
+
+        Args:
+            input_dict (dict): Dictionary with input parameters
+            counter (int): first index of the job to try
+            job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
+                                                job_name as string.
+
+        Returns:
+            str, int: absolute path of the working directory and the index of the job
+        """
+        working_directory = self._get_working_directory(
+            input_dict=input_dict, counter=counter, job_name_function=job_name_function
+        )
+        while os.path.exists(os.path.join(working_directory, "scisweeper.h5")):
+            counter += 1
+            working_directory_next = self._get_working_directory(
+                input_dict=input_dict,
+                counter=counter,
+                job_name_function=job_name_function,
+            )
+            if working_directory_next == working_directory:
+                raise ValueError(
+                    "The job "
+                    + os.path.basename(working_directory)
+                    + " already exists and the job_name_function does not depend on the counter."
+                )
+            working_directory = working_directory_next
+        return working_directory, counter
+
+    def subscribe(self, callback):
+        """
+        Subscribe to the events of the sweep. The callback is called with the keyword arguments event, job_name and
+        timestamp. The events 'started', 'input_written', 'executable_finished', 'output_collected', 'finished' and
+        'failed' are emitted by the jobs themselves - or 'skipped' when the job was already executed -, so they are only
+        available for the jobs executed in the current process - with the 'thread' and 'asyncio' backends or a
+        concurrent.futures.ThreadPoolExecutor. For these backends the event 'queued' is emitted when
+        run_jobs_in_parallel() submits a job to the pool or the executor. The callback is called from the worker threads
+        and has to be thread safe.
+
+        Args:
+            callback (function): event callback, for example a scisweeper.trace.ChromeTraceSink
+        """
+        self._subscriber_lst.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Remove an event callback.
+
+        Args:
+            callback (function): event callback
+        """
+        self._subscriber_lst.remove(callback)
+
+    def _emit_event(self, event, job_name, timestamp=None):
+        """
+        Internal helper function to pass an event to all subscribers.
+
+        Args:
+            event (str): name of the event
+            job_name (str): name of the job
+            timestamp (float/ None): time of the event in seconds since the epoch
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        for callback in self._subscriber_lst:
+            callback(event=event, job_name=job_name, timestamp=timestamp)
+
+    def _get_event_job_kwargs(self, backend):
+        """
+        Internal helper function to add the event callback to the keyword arguments of the jobs, when the jobs are
+        executed in the current process.
+
+        Args:
+            backend (str/ concurrent.futures.Executor): backend of run_jobs_in_parallel()
+
+        Returns:
+            dict: keyword arguments of the jobs
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        job_kwargs = self._job_kwargs
+        if len(self._subscriber_lst) > 0 and (
+            backend in ["thread", "asyncio"] or isinstance(backend, ThreadPoolExecutor)
         ):
-            self._job_class(working_directory=path).run_collect_output()
-        self.collect()
+            job_kwargs["event_callback"] = self._emit_event
+        return job_kwargs
 
-    def _check_jobs(self):
+    def _get_pending_jobs(
+        self,
+        input_dict_lst,
+        manifest,
+        job_name_function=None,
+        longest_first=False,
+        cost_function=None,
+    ):
         """
-        Internal helper function to check the jobs and build the results table.
+        Internal helper function to get the working directories and input dictionaries of the jobs which are not listed
+        as finished in the manifest - lazily in the order of input_dict_lst or sorted by the expected walltime.
+
+        Args:
+            input_dict_lst (list/ iterable): List of dictionaries with input parametern
+            manifest (SciSweeperManifest): manifest of the sweep
+            job_name_function (function/ None): Function which takes the input_dict and a counter as input to return the
+                                                job_name as string.
+            longest_first (bool): sort the jobs by the expected walltime, starting with the longest
+            cost_function (function/ None): Function which takes the input_dict as input to return the expected
+                                            walltime - by default a RuntimeModel is fitted to the recorded walltimes.
+
+        Returns:
+            generator/ list: tuples of working directory and input dictionary
         """
-        dict_lst, all_keys_lst, broken_jobs = [], [], []
-        for path in tqdm(
-            self._fileindex.dataframe[
-                ~self._fileindex.dataframe.is_directory
-            ].dirname.values
+        status_dict = manifest.read()
+        job_iter = (
+            (
+                self._get_working_directory(
+                    input_dict=input_dict,
+                    counter=counter,
+                    job_name_function=job_name_function,
+                ),
+                input_dict,
+            )
+            for counter, input_dict in enumerate(input_dict_lst)
+        )
+        if not longest_first:
+            return (
+                (working_directory, input_dict)
+                for working_directory, input_dict in job_iter
+                if status_dict.get(os.path.basename(working_directory)) != "finished"
+            )
+        job_lst = list(job_iter)
+        pending_lst = [
+            (working_directory, input_dict)
+            for working_directory, input_dict in job_lst
+            if status_dict.get(os.path.basename(working_directory)) != "finished"
+        ]
+        if cost_function is None:
+            from .runtime import RuntimeModel
+
+            walltime_dict = manifest.read_walltime()
+            finished_lst = [
+                (input_dict, walltime_dict[os.path.basename(working_directory)])
+                for working_directory, input_dict in job_lst
+                if os.path.basename(working_directory) in walltime_dict.keys()
+            ]
+            model = RuntimeModel()
+            model.fit(
+                input_dict_lst=[input_dict for input_dict, _ in finished_lst],
+                walltime_lst=[walltime for _, walltime in finished_lst],
+            )
+            cost_function = model.predict
+        return sorted(
+            pending_lst,
+            key=lambda job: cost_function(job[1]),
+            reverse=True,
+        )
+
+    @property
+    def _manifest(self):
+        from .manifest import SciSweeperManifest
+
+        return SciSweeperManifest(
+            os.path.join(self.working_directory, "scisweeper_manifest.txt")
+        )
+
+    @property
+    def _results_cache_file(self):
+        return os.path.join(self.working_directory, "scisweeper_results.pkl")
+
+    def _load_results_cache(self):
+        """
+        Internal helper function to load the results of the previous incremental collect.
+
+        Returns:
+            dict: Dictionary with the job directory as key and a tuple of (mtime, input_dict, output_dict) as value
+        """
+        if os.path.exists(self._results_cache_file):
+            with open(self._results_cache_file, "rb") as f:
+                return pickle.load(f)
+        else:
+            return {}
+
+    def _dump_results_cache(self, results_cache):
+        """
+        Internal helper function to store the results for the next incremental collect.
+
+        Args:
+            results_cache (dict): Dictionary with the job directory as key and a tuple of (mtime, input_dict,
+                                  output_dict) as value
+        """
+        with open(self._results_cache_file, "wb") as f:
+            pickle.dump(results_cache, f, protocol=2)
+
+    def _read_jobs(
+        self,
+        path_lst,
+        catalog_dict=None,
+        cores=1,
+        input_key_lst=None,
+        output_key_lst=None,
+    ):
+        """
+        Internal helper function to read the input and output of multiple jobs. Jobs which are listed in the catalog
+        dictionary are taken from there, the remaining jobs are read from their HDF5 files. When input or output keys
+        are selected only these keys are read from the HDF5 files.
+
+        Args:
+            path_lst (list): list of working directories
+            catalog_dict (dict/ None): jobs read from the sweep catalog
+            cores (int): number of worker processes to read the HDF5 files concurrently
+            input_key_lst (list/ None): input keys to read - all input keys for None
+            output_key_lst (list/ None): output keys to read - all output keys for None
+
+        Returns:
+            list: list of tuples of (input_dict, output_dict) in the order of path_lst
+        """
+        if catalog_dict is None:
+            catalog_dict = {}
+        if input_key_lst is None and output_key_lst is None:
+            function = partial(read_parallel, self._job_class)
+        else:
+            function = partial(read_keys_parallel, input_key_lst, output_key_lst)
+        path_hdf_lst = [path for path in path_lst if path not in catalog_dict.keys()]
+        hdf_dict = dict(
+            zip(
+                path_hdf_lst,
+                map_parallel(function=function, argument_lst=path_hdf_lst, cores=cores),
+            )
+        )
+        job_lst = []
+        for path in path_lst:
+            if path in catalog_dict.keys():
+                _, input_dict, output_dict = catalog_dict[path]
+                if input_key_lst is not None:
+                    input_dict = {
+                        k: v for k, v in input_dict.items() if k in input_key_lst
+                    }
+                if output_key_lst is not None:
+                    output_dict = {
+                        k: v for k, v in output_dict.items() if k in output_key_lst
+                    }
+                job_lst.append((input_dict, output_dict))
+            else:
+                job_lst.append(hdf_dict[path])
+        return job_lst
+
+    def _check_jobs(
+        self,
+        incremental=False,
+        cores=1,
+        input_key_lst=None,
+        output_key_lst=None,
+        compact=False,
+    ):
+        """
+        Internal helper function to check the jobs and build the results table. Jobs which are listed in the sweep
+        catalog are read from the catalog, only the remaining jobs and the jobs whose HDF5 file was modified after the
+        catalog row was written are read from their HDF5 files.
+
+        Args:
+            incremental (bool): reuse the previous results for jobs with unchanged modification time
+            cores (int): number of worker processes to read the HDF5 files concurrently
+            input_key_lst (list/ None): input keys to read - all input keys for None
+            output_key_lst (list/ None): output keys to read - all output keys for None
+            compact (bool): convert the columns to a memory compact representation
+
+        Returns:
+            pandas.DataFrame, list: results table and list of names of the broken jobs
+        """
+        df_files = self._fileindex.dataframe[~self._fileindex.dataframe.is_directory]
+        mtime_dict = dict(zip(df_files.dirname.values, df_files.mtime.values))
+        if self._catalog is not None:
+            catalog_dict = self._catalog.read(mtime_dict=mtime_dict)
+        else:
+            catalog_dict = {}
+        if incremental:
+            results_cache = self._load_results_cache()
+        else:
+            results_cache = {}
+        results_cache_new, path_lst = {}, []
+        for path, mtime in mtime_dict.items():
+            if path in results_cache.keys() and results_cache[path][0] == mtime:
+                results_cache_new[path] = results_cache[path]
+            else:
+                path_lst.append(path)
+        for path, (input_dict, output_dict) in zip(
+            path_lst,
+            self._read_jobs(
+                path_lst=path_lst,
+                catalog_dict=catalog_dict,
+                cores=cores,
+                input_key_lst=input_key_lst,
+                output_key_lst=output_key_lst,
+            ),
         ):
-            job_dict = {}
-            job_dict["dir"] = os.path.basename(path)
-            job = self._job_class(working_directory=path)
-            job.from_hdf()
-            for k, v in job.input_dict.items():
-                job_dict[k] = v
-            for k, v in job.output_dict.items():
-                job_dict[k] = v
-            for k in job_dict.keys():
-                all_keys_lst.append(k)
-            dict_lst.append(job_dict)
-        final_keys = list(set(all_keys_lst))
-        for d in dict_lst:
-            for k in final_keys:
-                broken_flag = False
-                if k not in d.keys():
-                    d[k] = np.nan
-                    broken_flag = True
-                if broken_flag:
-                    broken_jobs.append(d["dir"])
-        return dict_lst, broken_jobs
+            results_cache_new[path] = (mtime_dict[path], input_dict, output_dict)
+        if incremental:
+            self._dump_results_cache(results_cache_new)
+        return self._assemble_results(
+            job_lst=[
+                (os.path.basename(path),) + results_cache_new[path][1:]
+                for path in df_files.dirname.values
+            ],
+            compact=compact,
+        )
+
+    @staticmethod
+    def _assemble_results(job_lst, compact=False):
+        """
+        Internal helper function to build the results table column by column. Keys which are missing for a given job
+        are filled with NaN and a job is considered broken when any of the output columns is missing.
+
+        Args:
+            job_lst (list): list of tuples of (job_name, input_dict, output_dict)
+            compact (bool): convert the columns to a memory compact representation
+
+        Returns:
+            pandas.DataFrame, list: results table and list of names of the broken jobs
+        """
+        import pandas
+
+        number_of_jobs = len(job_lst)
+        columns = {"dir": [job[0] for job in job_lst]}
+        key_lst, output_key_lst = ["dir"], []
+        has_output = np.ones(number_of_jobs, dtype=bool)
+        for i, (_, input_dict, output_dict) in enumerate(job_lst):
+            if len(output_dict) == 0:
+                has_output[i] = False
+            for d, is_output in ((input_dict, False), (output_dict, True)):
+                for k, v in d.items():
+                    if k not in columns.keys():
+                        columns[k] = [np.nan] * number_of_jobs
+                        key_lst.append(k)
+                    if is_output and k not in output_key_lst:
+                        output_key_lst.append(k)
+                    columns[k][i] = v
+        if compact:
+            columns = {k: compact_column(values=v) for k, v in columns.items()}
+        df = pandas.DataFrame(columns, columns=key_lst)
+        broken_mask = ~has_output
+        if len(output_key_lst) > 0:
+            broken_mask |= df[output_key_lst].isna().any(axis=1).values
+        return df, list(df.dir.values[broken_mask])
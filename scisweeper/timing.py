@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+phase_lst = ["write_input", "executable", "collect_output", "to_hdf"]
+
+
+class PhaseTimer(object):
+    """
+    Measure the walltime and the CPU time of the phases of a job. The executable is waited for with os.wait4(), so its
+    CPU time and peak resident set size are taken from the resource usage of exactly this child process - including
+    the processes it waited for and the forked process before the executable is started. For the phases executed in
+    the current process the CPU time of the whole process is used, so when multiple jobs are executed by threads of
+    the same process it includes the other jobs running at the same time. The peak RSS of the current process is a
+    high-water mark of the whole process, so it is not recorded for these phases. On platforms without the resource
+    module only the walltime is measured.
+    """
+
+    def __init__(self):
+        self.timing_dict = {}
+
+    @contextmanager
+    def measure(self, phase, cputime=True):
+        """
+        Measure the phase executed in the body of the with statement.
+
+        Args:
+            phase (str): name of the phase
+            cputime (bool): record the CPU time of the current process
+        """
+        cputime_start = _get_cputime()
+        walltime_start = time.time()
+        yield
+        self.timing_dict[phase + "_walltime"] = time.time() - walltime_start
+        if cputime and resource is not None:
+            self.timing_dict[phase + "_cputime"] = _get_cputime() - cputime_start
+
+    def run_executable(self, executable, working_directory):
+        """
+        Execute the executable in a shell and record its walltime, CPU time and peak RSS as executable phase. The
+        standard output of the executable is discarded.
+
+        Args:
+            executable (str): shell command
+            working_directory (str): working directory of the executable
+
+        Raises:
+            subprocess.CalledProcessError: if the executable returns a non-zero exit code - the exception contains the
+                                           standard error of the executable
+        """
+        walltime_start = time.time()
+        process = subprocess.Popen(
+            executable,
+            cwd=working_directory,
+            shell=True,
+            universal_newlines=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if resource is not None and hasattr(os, "wait4"):
+            with process.stderr:
+                stderr = process.stderr.read()
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = _get_returncode(status=status)
+            self.timing_dict["executable_cputime"] = usage.ru_utime + usage.ru_stime
+            self.timing_dict["executable_maxrss"] = _get_kilobytes(usage.ru_maxrss)
+        else:
+            _, stderr = process.communicate()
+        self.timing_dict["executable_walltime"] = time.time() - walltime_start
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode=process.returncode, cmd=executable, stderr=stderr
+            )
+
+
+def _get_cputime():
+    """
+    Internal function to get the user and system CPU time of the current process.
+
+    Returns:
+        float: CPU time in seconds
+    """
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _get_kilobytes(maxrss):
+    """
+    Internal function to convert the peak resident set size reported by the resource module to kilobytes.
+
+    Args:
+        maxrss (int): peak resident set size in kilobytes - in bytes on macOS
+
+    Returns:
+        int: peak resident set size in kilobytes
+    """
+    if sys.platform == "darwin":
+        return maxrss // 1024
+    return maxrss
+
+
+def _get_returncode(status):
+    """
+    Internal function to convert the exit status returned by os.wait4() to a return code like subprocess.Popen.
+
+    Args:
+        status (int): exit status
+
+    Returns:
+        int: exit code - or the negative signal number if the process was terminated by a signal
+    """
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
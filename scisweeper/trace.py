@@ -0,0 +1,160 @@
+import json
+import threading
+
+phase_event_dict = {
+    "input_written": "write_input",
+    "executable_finished": "executable",
+    "output_collected": "collect_output",
+    "finished": "to_hdf",
+    "failed": "failed",
+}
+
+
+class ChromeTraceSink(object):
+    """
+    Event callback for SciSweeper.subscribe() which records the timeline of a sweep and writes it as Chrome trace JSON,
+    which can be opened in chrome://tracing or https://ui.perfetto.dev. Every running job is placed on the lowest free
+    worker lane, so the lanes correspond to the worker threads of the pool. Each job is shown as a slice with the
+    phases write_input, executable, collect_output and to_hdf as sub slices, failed jobs are marked with an instant
+    event and the number of queued jobs which did not start yet is shown as counter - idle lanes while jobs are queued
+    indicate pool starvation. Jobs which are skipped, because they were already executed, leave the queue without
+    occupying a lane.
+
+    Args:
+        file_name (str): path of the trace file
+    """
+
+    def __init__(self, file_name):
+        self._file_name = file_name
+        self._lock = threading.Lock()
+        self._event_lst = []
+        self._job_dict = {}
+        self._lane_lst = []
+        self._queued_set = set()
+        self._start_time = None
+
+    @property
+    def file_name(self):
+        return self._file_name
+
+    def __call__(self, event, job_name, timestamp):
+        """
+        Record an event of the sweep.
+
+        Args:
+            event (str): name of the event
+            job_name (str): name of the job
+            timestamp (float): time of the event in seconds since the epoch
+        """
+        with self._lock:
+            if self._start_time is None:
+                self._start_time = timestamp
+            ts = (timestamp - self._start_time) * 1e6
+            if event == "queued":
+                self._queued_set.add(job_name)
+                self._add_counter(ts=ts)
+            elif event in ["started", "skipped"]:
+                if job_name in self._queued_set:
+                    self._queued_set.remove(job_name)
+                    self._add_counter(ts=ts)
+                if event == "started":
+                    self._job_dict[job_name] = (self._get_lane(), ts, ts)
+            elif event in phase_event_dict.keys() and job_name in self._job_dict:
+                lane, job_start, phase_start = self._job_dict[job_name]
+                if event == "failed":
+                    self._event_lst.append(
+                        {
+                            "name": "failed",
+                            "ph": "i",
+                            "s": "t",
+                            "ts": ts,
+                            "pid": 0,
+                            "tid": lane,
+                            "args": {"job": job_name},
+                        }
+                    )
+                else:
+                    self._add_slice(
+                        name=phase_event_dict[event],
+                        cat="phase",
+                        lane=lane,
+                        start=phase_start,
+                        end=ts,
+                        job_name=job_name,
+                    )
+                if event in ["finished", "failed"]:
+                    self._add_slice(
+                        name=job_name,
+                        cat="job",
+                        lane=lane,
+                        start=job_start,
+                        end=ts,
+                        job_name=job_name,
+                    )
+                    self._lane_lst[lane] = False
+                    del self._job_dict[job_name]
+                else:
+                    self._job_dict[job_name] = (lane, job_start, ts)
+
+    def get_trace(self):
+        """
+        Get the recorded timeline.
+
+        Returns:
+            dict: Chrome trace
+        """
+        with self._lock:
+            thread_name_lst = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 0,
+                    "tid": lane,
+                    "args": {"name": "worker " + str(lane)},
+                }
+                for lane in range(len(self._lane_lst))
+            ]
+            return {
+                "traceEvents": thread_name_lst + self._event_lst,
+                "displayTimeUnit": "ms",
+            }
+
+    def write(self):
+        """
+        Write the recorded timeline to the trace file.
+        """
+        with open(self._file_name, "w") as f:
+            json.dump(self.get_trace(), f)
+
+    def _get_lane(self):
+        for lane, busy in enumerate(self._lane_lst):
+            if not busy:
+                self._lane_lst[lane] = True
+                return lane
+        self._lane_lst.append(True)
+        return len(self._lane_lst) - 1
+
+    def _add_counter(self, ts):
+        self._event_lst.append(
+            {
+                "name": "queued",
+                "ph": "C",
+                "ts": ts,
+                "pid": 0,
+                "args": {"jobs": len(self._queued_set)},
+            }
+        )
+
+    def _add_slice(self, name, cat, lane, start, end, job_name):
+        self._event_lst.append(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": 0,
+                "tid": lane,
+                "args": {"job": job_name},
+            }
+        )
@@ -20,15 +20,14 @@ setup(
                  'License :: OSI Approved :: BSD License',
                  'Intended Audience :: Science/Research',
                  'Operating System :: OS Independent',
-                 'Programming Language :: Python :: 2.7',
                  'Programming Language :: Python :: 3',
-                 'Programming Language :: Python :: 3.4',
-                 'Programming Language :: Python :: 3.5',
-                 'Programming Language :: Python :: 3.6',
-                 'Programming Language :: Python :: 3.7'],
+                 'Programming Language :: Python :: 3.7',
+                 'Programming Language :: Python :: 3.8',
+                 'Programming Language :: Python :: 3.9'],
 
     keywords='scisweeper',
     packages=find_packages(exclude=["*tests*", "*binder*", "*notebooks*"]),
+    python_requires='>=3.7',
     install_requires=['pandas', 'numpy', 'pysqa', 'h5io', 'pyfileindex', 'tqdm'],
     data_files=[("", ["LICENSE"])],
     cmdclass=versioneer.get_cmdclass(),
@@ -0,0 +1,44 @@
+"""
+Benchmark the startup time of the command line interface, which is executed for every job submitted to a queuing
+system, and list the heavy modules it imports.
+
+Usage:
+    python tests/benchmark/benchmark_cli_startup.py [repetitions]
+"""
+
+import subprocess
+import sys
+import time
+
+
+heavy_module_lst = ["pandas", "pysqa", "pyfileindex", "tqdm", "sqlite3", "asyncio"]
+
+
+def benchmark_cli_startup(repetitions=10):
+    time_lst = []
+    for _ in range(repetitions):
+        start = time.time()
+        subprocess.check_output(
+            [sys.executable, "-m", "scisweeper.cli", "-h"], universal_newlines=True
+        )
+        time_lst.append(time.time() - start)
+    imported_lst = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, scisweeper.cli; print(' '.join(m for m in "
+            + repr(heavy_module_lst)
+            + " if m in sys.modules))",
+        ],
+        universal_newlines=True,
+    ).split()
+    print(
+        "python -m scisweeper.cli - min: {0:.3f}s, mean: {1:.3f}s, heavy imports: {2}".format(
+            min(time_lst), sum(time_lst) / len(time_lst), imported_lst
+        )
+    )
+    return {"cli_startup": min(time_lst)}
+
+
+if __name__ == "__main__":
+    benchmark_cli_startup(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,71 @@
+"""
+Benchmark the scaling of SciSweeper.collect() with the number of worker processes.
+
+Usage:
+    python tests/benchmark/benchmark_collect.py [number_of_jobs] [max_cores]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from scisweeper.scisweeper import SciSweeperJob, SciSweeper
+
+
+class SyntheticSciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return "true"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        pass
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        return {}
+
+
+def create_synthetic_sweep(working_directory, number_of_jobs):
+    for i in range(number_of_jobs):
+        job = SyntheticSciSweeper(
+            working_directory=os.path.join(working_directory, "job_" + str(i)),
+            input_dict={"value_1": i, "value_2": 2 * i},
+        )
+        job.output_dict = {"result": [i, 1], "energy": float(i)}
+        job.to_hdf()
+
+
+def benchmark_collect(number_of_jobs=10000, max_cores=None):
+    if max_cores is None:
+        max_cores = os.cpu_count()
+    result_dict = {}
+    working_directory = tempfile.mkdtemp()
+    try:
+        create_synthetic_sweep(
+            working_directory=working_directory, number_of_jobs=number_of_jobs
+        )
+        ssw = SciSweeper(working_directory=working_directory)
+        ssw.job_class = SyntheticSciSweeper
+        cores = 1
+        while cores <= max_cores:
+            start = time.time()
+            ssw.collect(cores=cores)
+            duration = time.time() - start
+            print(
+                "jobs: {0}, cores: {1}, collect: {2:.2f}s".format(
+                    number_of_jobs, cores, duration
+                )
+            )
+            result_dict["collect_{0}_jobs_{1}_cores".format(number_of_jobs, cores)] = (
+                duration
+            )
+            cores *= 2
+    finally:
+        shutil.rmtree(working_directory)
+    return result_dict
+
+
+if __name__ == "__main__":
+    benchmark_collect(*[int(a) for a in sys.argv[1:]])
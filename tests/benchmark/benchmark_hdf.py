@@ -0,0 +1,82 @@
+"""
+Benchmark to_hdf() and from_hdf() round trips of SciSweeperJobs with large output arrays for the h5io and the native
+output storage.
+
+Usage:
+    python tests/benchmark/benchmark_hdf.py [array_length] [repetitions]
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+from scisweeper.scisweeper import SciSweeperJob
+
+
+class ArraySciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return "true"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        pass
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        return {}
+
+
+def benchmark_hdf(array_length=1000000, repetitions=5):
+    rng = np.random.default_rng(0)
+    output_dict = {
+        "energy": 1.0,
+        "forces": rng.random((array_length // 3, 3)),
+        "positions": rng.random(array_length),
+    }
+    result_dict = {}
+    for output_storage, output_compression in [
+        ("h5io", None),
+        ("native", None),
+        ("native", "gzip"),
+    ]:
+        working_directory = tempfile.mkdtemp()
+        try:
+            write_lst, read_lst = [], []
+            for _ in range(repetitions):
+                job = ArraySciSweeper(
+                    working_directory=working_directory,
+                    input_dict={"value_1": 1},
+                    output_storage=output_storage,
+                    output_compression=output_compression,
+                )
+                job.output_dict = output_dict
+                start = time.time()
+                job.to_hdf()
+                write_lst.append(time.time() - start)
+                job = ArraySciSweeper(working_directory=working_directory)
+                start = time.time()
+                job.from_hdf()
+                read_lst.append(time.time() - start)
+            size = os.path.getsize(os.path.join(working_directory, "scisweeper.h5"))
+        finally:
+            shutil.rmtree(working_directory)
+        name = (
+            output_storage
+            if output_compression is None
+            else output_storage + "_" + output_compression
+        )
+        print(
+            "array length: {0}, storage: {1}, to_hdf: {2:.3f}s, from_hdf: {3:.3f}s, file size: {4:.1f} MB".format(
+                array_length, name, min(write_lst), min(read_lst), size / 1e6
+            )
+        )
+        result_dict["to_hdf_{0}_{1}".format(name, array_length)] = min(write_lst)
+        result_dict["from_hdf_{0}_{1}".format(name, array_length)] = min(read_lst)
+    return result_dict
+
+
+if __name__ == "__main__":
+    benchmark_hdf(*[int(a) for a in sys.argv[1:]])
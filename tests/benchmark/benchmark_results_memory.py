@@ -0,0 +1,52 @@
+"""
+Benchmark the memory consumption of the results table with and without the compact representation.
+
+Usage:
+    python tests/benchmark/benchmark_results_memory.py [number_of_jobs] [array_length]
+"""
+
+import sys
+import tracemalloc
+from scisweeper.scisweeper import SciSweeper
+
+
+def create_job_lst(number_of_jobs, array_length):
+    job_lst = []
+    for i in range(number_of_jobs):
+        output_dict = {
+            "energy": float(i),
+            "status": ["converged", "not_converged"][i % 2],
+            "result": list(range(i, i + array_length)),
+        }
+        if i % 100 == 0:
+            output_dict["warning_count"] = 1
+        job_lst.append(("job_" + str(i), {"value_1": i, "value_2": 2 * i}, output_dict))
+    return job_lst
+
+
+def measure_results_memory(number_of_jobs, array_length, compact):
+    # The job list is created while tracing, as the results read from the HDF5 files are only referenced by the
+    # results table after the collect.
+    tracemalloc.start()
+    job_lst = create_job_lst(number_of_jobs=number_of_jobs, array_length=array_length)
+    df, _ = SciSweeper._assemble_results(job_lst=job_lst, compact=compact)
+    del job_lst
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def benchmark_results_memory(number_of_jobs=100000, array_length=100):
+    for compact in [False, True]:
+        current, peak = measure_results_memory(
+            number_of_jobs=number_of_jobs, array_length=array_length, compact=compact
+        )
+        print(
+            "jobs: {0}, compact: {1}, results table: {2:.1f} MB, peak: {3:.1f} MB".format(
+                number_of_jobs, compact, current / 1e6, peak / 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_results_memory(*[int(a) for a in sys.argv[1:]])
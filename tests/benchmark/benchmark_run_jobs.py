@@ -0,0 +1,63 @@
+"""
+Benchmark the orchestration overhead of SciSweeper.run_jobs_in_parallel() with a no-op executable, so the measured
+time is spent in creating the jobs, writing the HDF5 files and the pool.
+
+Usage:
+    python tests/benchmark/benchmark_run_jobs.py [number_of_jobs] [max_cores]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from scisweeper.scisweeper import SciSweeperJob, SciSweeper
+
+
+class NoOpSciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return "true"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        pass
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        return {"result": 1}
+
+
+def benchmark_run_jobs(number_of_jobs=1000, max_cores=None, backend="thread"):
+    if max_cores is None:
+        max_cores = os.cpu_count()
+    result_dict = {}
+    cores = 1
+    while cores <= max_cores:
+        working_directory = tempfile.mkdtemp()
+        try:
+            ssw = SciSweeper(working_directory=working_directory)
+            ssw.job_class = NoOpSciSweeper
+            start = time.time()
+            ssw.run_jobs_in_parallel(
+                input_dict_lst=({"value_1": i} for i in range(number_of_jobs)),
+                cores=cores,
+                backend=backend,
+            )
+            duration = time.time() - start
+        finally:
+            shutil.rmtree(working_directory)
+        print(
+            "jobs: {0}, cores: {1}, run_jobs_in_parallel: {2:.2f}s, per job: {3:.2f}ms".format(
+                number_of_jobs, cores, duration, 1000 * duration / number_of_jobs
+            )
+        )
+        result_dict[
+            "run_jobs_in_parallel_{0}_jobs_{1}_cores".format(number_of_jobs, cores)
+        ] = duration
+        cores *= 2
+    return result_dict
+
+
+if __name__ == "__main__":
+    benchmark_run_jobs(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,60 @@
+"""
+Run the benchmark suite - the orchestration overhead of run_jobs_in_parallel() for 1k and 10k jobs, collect() for 10k
+and 100k jobs, to_hdf()/ from_hdf() round trips with large arrays and the startup of the command line interface. The
+timings are written to a JSON file, and when a baseline JSON file from a previous run is given, the ratio to the
+baseline is printed for each benchmark to make performance regressions visible.
+
+Usage:
+    python tests/benchmark/run_benchmarks.py [--quick] [--output results.json] [--baseline baseline.json]
+
+The quick mode uses 10 times smaller sweeps and arrays.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_cli_startup import benchmark_cli_startup
+from benchmark_collect import benchmark_collect
+from benchmark_hdf import benchmark_hdf
+from benchmark_run_jobs import benchmark_run_jobs
+
+
+def run_benchmarks(quick=False):
+    scale = 10 if quick else 1
+    result_dict = {}
+    for number_of_jobs in [1000, 10000]:
+        result_dict.update(benchmark_run_jobs(number_of_jobs=number_of_jobs // scale))
+    for number_of_jobs in [10000, 100000]:
+        result_dict.update(benchmark_collect(number_of_jobs=number_of_jobs // scale))
+    for array_length in [1000000, 10000000]:
+        result_dict.update(benchmark_hdf(array_length=array_length // scale))
+    result_dict.update(benchmark_cli_startup())
+    return result_dict
+
+
+def compare(result_dict, baseline_dict):
+    for k, v in sorted(result_dict.items()):
+        if k in baseline_dict.keys() and baseline_dict[k] > 0:
+            print(
+                "{0}: {1:.3f}s, baseline: {2:.3f}s, ratio: {3:.2f}".format(
+                    k, v, baseline_dict[k], v / baseline_dict[k]
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None)
+    args = parser.parse_args()
+    result_dict = run_benchmarks(quick=args.quick)
+    with open(args.output, "w") as f:
+        json.dump(result_dict, f, indent=2, sort_keys=True)
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            compare(result_dict=result_dict, baseline_dict=json.load(f))
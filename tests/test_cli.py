@@ -1,5 +1,6 @@
 import unittest
 import os
+import shutil
 import subprocess
 from scisweeper.scisweeper import SciSweeperJob
 
@@ -72,6 +73,37 @@ class TestSciSweeperCli(unittest.TestCase):
         os.remove(os.path.join(file_location, "calc_test_job", "job", "scisweeper.h5"))
         os.removedirs(os.path.join(file_location, "calc_test_job", "job"))
 
+    def test_cli_workers(self):
+        path_sweep = os.path.join(file_location, "calc_test_workers")
+        for i in range(6):
+            BashSciSweeper(
+                working_directory=os.path.join(path_sweep, "job_" + str(i)),
+                input_dict={"value_1": i, "value_2": 2, "value_3": 3},
+            ).to_hdf()
+        process_lst = [
+            subprocess.Popen(
+                ["python", "-m", "scisweeper.cli", "-w", path_sweep], cwd=file_location
+            )
+            for _ in range(3)
+        ]
+        self.assertEqual([p.wait() for p in process_lst], [0, 0, 0])
+        for i in range(6):
+            path_job = os.path.join(path_sweep, "job_" + str(i))
+            self.assertTrue(os.path.exists(os.path.join(path_job, "scisweeper.claim")))
+            job = BashSciSweeper(working_directory=path_job)
+            job.from_hdf()
+            self.assertEqual(job.output_dict["result"], [i + 6, 1])
+        shutil.rmtree(path_sweep)
+
+    def test_cli_lazy_imports(self):
+        out = subprocess.check_output(
+            "python -c \"import sys, scisweeper.cli; print([m for m in ['pandas', 'pysqa', 'pyfileindex', 'tqdm'] if m in sys.modules])\"",
+            cwd=file_location,
+            shell=True,
+            universal_newlines=True,
+        )
+        self.assertEqual(out.strip(), "[]")
+
     def test_error(self):
         out = subprocess.check_output(
             "python -m scisweeper.cli -x",
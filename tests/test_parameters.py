@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+from scisweeper.parameters import (
+    grid,
+    zip_axes,
+    random_samples,
+    latin_hypercube,
+    sobol,
+)
+
+try:
+    import scipy
+
+    skip_sobol = False
+except ImportError:
+    skip_sobol = True
+
+
+class TestParameters(unittest.TestCase):
+    def test_grid(self):
+        input_dict_lst = list(grid(a=[1, 2], b=["x", "y", "z"]))
+        self.assertEqual(len(input_dict_lst), 6)
+        self.assertEqual(input_dict_lst[0], {"a": 1, "b": "x"})
+        self.assertEqual(input_dict_lst[-1], {"a": 2, "b": "z"})
+
+    def test_zip_axes(self):
+        self.assertEqual(
+            list(zip_axes(a=[1, 2], b=[3, 4])), [{"a": 1, "b": 3}, {"a": 2, "b": 4}]
+        )
+
+    def test_random_samples(self):
+        input_dict_lst = list(
+            random_samples(n=25, seed=1, chunk_size=10, a=(0, 1), b=(10, 20))
+        )
+        self.assertEqual(len(input_dict_lst), 25)
+        self.assertTrue(
+            all(0 <= d["a"] <= 1 and 10 <= d["b"] <= 20 for d in input_dict_lst)
+        )
+        self.assertEqual(
+            input_dict_lst, list(random_samples(n=25, seed=1, a=(0, 1), b=(10, 20)))
+        )
+
+    def test_latin_hypercube(self):
+        input_dict_lst = list(latin_hypercube(n=10, seed=1, a=(0, 10), b=(-1, 0)))
+        self.assertEqual(len(input_dict_lst), 10)
+        self.assertEqual(
+            sorted(np.floor([d["a"] for d in input_dict_lst]).tolist()),
+            list(range(10)),
+        )
+
+    @unittest.skipIf(skip_sobol, "scipy is not installed")
+    def test_sobol(self):
+        input_dict_lst = list(sobol(n=16, seed=1, chunk_size=5, a=(0, 1), b=(0, 2)))
+        self.assertEqual(len(input_dict_lst), 16)
+        self.assertTrue(all(0 <= d["b"] <= 2 for d in input_dict_lst))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,22 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import h5io
+import h5py
+import json
+import numpy as np
+import pandas
 import unittest
+from unittest import mock
 import os
+import shutil
+import subprocess
+import sys
+from scisweeper.adaptive import BisectionStrategy, RefinementStrategy
+from scisweeper.hdf import read_keys, read_timing
+from scisweeper.parameters import grid
+from scisweeper.runtime import RuntimeModel
 from scisweeper.scisweeper import SciSweeperJob, SciSweeper
+from scisweeper.trace import ChromeTraceSink
 
 
 file_location = os.path.dirname(os.path.abspath(__file__))
@@ -48,6 +64,81 @@ class BashSciSweeper2(SciSweeperJob):
         return {"result": int(output[0])}
 
 
+class SquareSciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return "cp input_file output.log"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        import os
+
+        with open(os.path.join(working_directory, "input_file"), "w") as f:
+            f.writelines(str(input_dict["x"] ** 2))
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        import os
+
+        with open(os.path.join(working_directory, "output.log"), "r") as f:
+            return {"y": float(f.read())}
+
+
+class SleepSciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return "sleep $(cat input_file)"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        import os
+
+        with open(os.path.join(working_directory, "input_file"), "w") as f:
+            f.writelines(str(input_dict["t"]))
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        import os
+
+        with open(os.path.join(working_directory, "input_file"), "r") as f:
+            return {"t": float(f.read())}
+
+
+class MemorySciSweeper(SciSweeperJob):
+    @property
+    def executable(self):
+        return sys.executable + " memory.py"
+
+    @staticmethod
+    def write_input(input_dict, working_directory="."):
+        import os
+
+        with open(os.path.join(working_directory, "memory.py"), "w") as f:
+            f.writelines('b = b"1" * (' + str(input_dict["mb"]) + " * 1024 ** 2)")
+
+    @staticmethod
+    def collect_output(working_directory="."):
+        return {"finished": True}
+
+
+class FailingSciSweeper(BashSciSweeper):
+    @property
+    def executable(self):
+        return "echo failed >&2; exit 3"
+
+
+class LocalQueueAdapter(object):
+    def __init__(self):
+        self.submitted = []
+
+    def submit_job(self, command, working_directory, job_name, cores):
+        self.submitted.append((command, job_name, cores))
+        subprocess.check_output(
+            command, cwd=working_directory, shell=True, universal_newlines=True
+        )
+        return len(self.submitted)
+
+
 class TestSciSweeper(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
@@ -63,7 +154,34 @@ class TestSciSweeper(unittest.TestCase):
                 os.remove(os.path.join(file_location, d, j, "input_file"))
                 os.remove(os.path.join(file_location, d, j, "output.log"))
                 os.remove(os.path.join(file_location, d, j, "scisweeper.h5"))
+                manifest_file = os.path.join(
+                    file_location, d, "scisweeper_manifest.txt"
+                )
+                if os.path.exists(manifest_file):
+                    os.remove(manifest_file)
                 os.removedirs(os.path.join(file_location, d, j))
+            shutil.rmtree(os.path.join(file_location, "calc_test_catalog"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_incremental"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_parallel_collect"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_broken"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_backend"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_asyncio"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_bundle"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_pilot"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_definitions"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_iter_results"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_native"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_columns"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_cache"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_cache_key"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_generator"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_adaptive"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_manifest"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_longest_first"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_timing"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_max_pending"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_events"))
+            shutil.rmtree(os.path.join(file_location, "calc_test_failures"))
 
     def test_sweeper(self):
         if os.name != "nt":
@@ -127,6 +245,919 @@ class TestSciSweeper(unittest.TestCase):
             self.assertEqual(self.ssw.results.value_3.values[0], 3)
             self.assertEqual(self.ssw.results.dir.values[0], "job_0")
 
+    def test_catalog(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_catalog"),
+                catalog=True,
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": 1, "value_2": 2, "value_3": 3},
+                    {"value_1": 2, "value_2": 2, "value_3": 3},
+                ]
+            )
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(self.ssw.working_directory, "scisweeper.db")
+                )
+            )
+            catalog_dict = self.ssw.catalog.read()
+            self.assertEqual(len(catalog_dict), 2)
+            status, input_dict, output_dict = catalog_dict[
+                os.path.join(self.ssw.working_directory, "job_1")
+            ]
+            self.assertEqual(status, "finished")
+            self.assertEqual(input_dict["value_1"], 2)
+            self.assertEqual(output_dict["result"], [8, 1])
+            BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_2"),
+                input_dict={"value_1": 3, "value_2": 2, "value_3": 3},
+            ).run()
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(list(df.dir.values), ["job_0", "job_1", "job_2"])
+            self.assertEqual(list(df.value_1.values), [1, 2, 3])
+            self.assertEqual([r[0] for r in df.result.values], [7, 8, 9])
+            self.assertEqual(len(self.ssw.broken_jobs), 0)
+            BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_1"),
+                input_dict={"value_1": 4, "value_2": 2, "value_3": 3},
+            ).run(run_again=True)
+            file_name = os.path.join(
+                self.ssw.working_directory, "job_1", "scisweeper.h5"
+            )
+            os.utime(
+                file_name,
+                (os.path.getatime(file_name), os.path.getmtime(file_name) + 10),
+            )
+            self.assertEqual(
+                len(
+                    self.ssw.catalog.read(
+                        mtime_dict={
+                            os.path.join(self.ssw.working_directory, "job_1"): 0.0
+                        }
+                    )
+                ),
+                1,
+            )
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(list(df.value_1.values), [1, 4, 3])
+            self.assertEqual([r[0] for r in df.result.values], [7, 10, 9])
+
+    def test_collect_incremental(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_incremental")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[{"value_1": 1, "value_2": 2, "value_3": 3}]
+            )
+            self.ssw.collect(incremental=True)
+            self.assertTrue(os.path.exists(self.ssw._results_cache_file))
+            results_cache = self.ssw._load_results_cache()
+            path_job_0 = os.path.join(self.ssw.working_directory, "job_0")
+            results_cache[path_job_0][1]["value_1"] = 42
+            self.ssw._dump_results_cache(results_cache)
+            self.ssw.run_job(
+                job_working_directory=os.path.join(self.ssw.working_directory, "job_1"),
+                input_dict={"value_1": 2, "value_2": 2, "value_3": 3},
+            )
+            self.ssw.collect(incremental=True)
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(list(df.dir.values), ["job_0", "job_1"])
+            self.assertEqual(list(df.value_1.values), [42, 2])
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(list(df.value_1.values), [1, 2])
+
+    def test_collect_parallel(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(
+                    file_location, "calc_test_parallel_collect"
+                )
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(4)
+                ],
+                cores=2,
+            )
+            self.ssw.collect()
+            df_serial = self.ssw.results
+            self.ssw.collect(cores=2)
+            df_parallel = self.ssw.results
+            self.assertEqual(list(df_serial.dir.values), list(df_parallel.dir.values))
+            self.assertEqual(
+                list(df_serial.value_1.values), list(df_parallel.value_1.values)
+            )
+            self.assertEqual(
+                sorted([r[0] for r in df_parallel.result.values]), [6, 7, 8, 9]
+            )
+            self.ssw.job_class = BashSciSweeper2
+            self.ssw.run_collect_output(cores=2)
+            self.assertEqual(sorted(self.ssw.results.result.values), [6, 7, 8, 9])
+
+    def test_broken_jobs(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_broken")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[{"value_1": 1, "value_2": 2, "value_3": 3}]
+            )
+            BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_1"),
+                input_dict={"value_1": 2, "value_2": 2, "value_3": 3},
+            ).to_hdf()
+            self.ssw.collect()
+            self.assertEqual(
+                self.ssw.broken_jobs,
+                [os.path.join(self.ssw.working_directory, "job_1")],
+            )
+
+    def test_backend(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_backend")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(2)
+                ],
+                cores=2,
+                backend="process",
+            )
+            with ThreadPoolExecutor(max_workers=2) as exe:
+                self.ssw.job_name_function = job_name
+                self.ssw.run_jobs_in_parallel(
+                    input_dict_lst=[
+                        {"value_1": i, "value_2": 2, "value_3": 3} for i in range(2)
+                    ],
+                    backend=exe,
+                )
+            self.ssw.collect()
+            self.assertEqual(
+                sorted(self.ssw.results.dir.values),
+                ["job_0", "job_0_0", "job_1", "job_1_1"],
+            )
+            self.assertEqual(len(self.ssw.broken_jobs), 0)
+            with self.assertRaises(ValueError):
+                self.ssw.run_jobs_in_parallel(input_dict_lst=[], backend="mpi")
+
+    def test_asyncio(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_asyncio")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(3)
+                ],
+                cores=2,
+                backend="asyncio",
+            )
+            self.ssw.job_name_function = job_name
+            asyncio.run(
+                self.ssw.run_jobs_async(
+                    input_dict_lst=[{"value_1": 5, "value_2": 2, "value_3": 3}]
+                )
+            )
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(
+                list(df.dir.values), ["job_0", "job_0_5", "job_1", "job_2"]
+            )
+            self.assertEqual([r[0] for r in df.result.values], [6, 11, 7, 8])
+            job = BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_3"),
+                input_dict={"value_1": 1, "value_2": 2, "value_3": 3},
+            )
+            asyncio.run(job.run_async())
+            self.assertEqual(job.output_dict["result"], [7, 1])
+
+    def test_bundle(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_bundle"),
+                pysqa_config=LocalQueueAdapter(),
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(5)
+                ],
+                bundle_size=2,
+                bundle_cores=2,
+            )
+            self.assertEqual(len(self.ssw.pysqa.submitted), 3)
+            self.assertEqual(
+                [j[1] for j in self.ssw._job_id_lst],
+                [
+                    "scisweeper_bundle_job_0",
+                    "scisweeper_bundle_job_2",
+                    "scisweeper_bundle_job_4",
+                ],
+            )
+            self.assertEqual(self.ssw.pysqa.submitted[0][2], 2)
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual([r[0] for r in df.result.values], [6, 7, 8, 9, 10])
+            self.assertEqual(len(self.ssw.broken_jobs), 0)
+
+    def test_pilot_workers(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_pilot"),
+                pysqa_config=LocalQueueAdapter(),
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(3)
+                ],
+                pilot_workers=2,
+            )
+            self.assertEqual(
+                [j[1] for j in self.ssw._job_id_lst],
+                ["scisweeper_worker_0", "scisweeper_worker_1"],
+            )
+            self.ssw.collect()
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual([r[0] for r in df.result.values], [6, 7, 8])
+            with self.assertRaises(ValueError):
+                self.ssw.run_jobs_in_parallel(
+                    input_dict_lst=[{"value_1": 3, "value_2": 2, "value_3": 3}],
+                    bundle_size=2,
+                    pilot_workers=2,
+                )
+
+    def test_assemble_results(self):
+        df, broken_jobs = SciSweeper._assemble_results(
+            job_lst=[
+                ("job_0", {"a": 1}, {"x": 1.0, "y": [1, 2]}),
+                ("job_1", {"a": 2, "b": 3}, {"x": 2.0, "y": [3, 4]}),
+                ("job_2", {"a": 3}, {"x": 3.0}),
+                ("job_3", {"a": 4}, {}),
+            ]
+        )
+        self.assertEqual(list(df.columns), ["dir", "a", "x", "y", "b"])
+        self.assertEqual(list(df.a.values), [1, 2, 3, 4])
+        self.assertEqual(df.y.values[1], [3, 4])
+        self.assertEqual(broken_jobs, ["job_2", "job_3"])
+
+    def test_function_cache(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_sweeper")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[{"value_1": 1, "value_2": 2, "value_3": 3}],
+                job_name_function=job_name,
+            )
+            path_job = os.path.join(self.ssw.working_directory, "job_0_1")
+            job_1 = SciSweeperJob(working_directory=path_job)
+            job_1.from_hdf()
+            job_2 = SciSweeperJob(working_directory=path_job)
+            job_2.from_hdf()
+            self.assertIs(job_1.write_input, job_2.write_input)
+            self.assertIs(job_1.collect_output, job_2.collect_output)
+            self.assertEqual(job_2.collect_output(path_job)["result"], [7, 1])
+            job_2.from_hdf()
+            self.assertFalse(SciSweeperJob._is_implemented("write_input"))
+            self.assertTrue(BashSciSweeper._is_implemented("collect_output"))
+
+    def test_definitions(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_definitions"),
+                definitions=True,
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(2)
+                ]
+            )
+            path_definitions = os.path.join(
+                self.ssw.working_directory, "scisweeper_definitions"
+            )
+            self.assertEqual(len(os.listdir(path_definitions)), 2)
+            path_job = os.path.join(self.ssw.working_directory, "job_1")
+            settings_dict = h5io.read_hdf5(os.path.join(path_job, "scisweeper.h5"))[
+                "settings"
+            ]
+            self.assertNotIn("write_input", settings_dict.keys())
+            self.assertIn(
+                settings_dict["collect_output_hash"] + ".py",
+                os.listdir(path_definitions),
+            )
+            job = SciSweeperJob(working_directory=path_job)
+            job.from_hdf()
+            self.assertEqual(job.definitions, path_definitions)
+            self.assertEqual(job.collect_output(path_job)["result"], [7, 1])
+            job.run_collect_output()
+            self.assertEqual(len(os.listdir(path_definitions)), 2)
+            self.ssw.collect()
+            self.assertEqual(sorted(self.ssw.results.value_1.values), [0, 1])
+
+    def test_iter_results(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_iter_results"),
+                catalog=True,
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(5)
+                ]
+            )
+            df_lst = list(
+                self.ssw.iter_results(chunk_size=2, columns=["value_1", "result"])
+            )
+            self.assertEqual([len(df) for df in df_lst], [2, 2, 1])
+            for df in df_lst:
+                self.assertEqual(list(df.columns), ["dir", "value_1", "result"])
+            self.assertEqual(
+                sorted([r[0] for df in df_lst for r in df.result.values]),
+                [6, 7, 8, 9, 10],
+            )
+            self.ssw.catalog = False
+            df_lst = list(self.ssw.iter_results(chunk_size=3))
+            self.assertEqual([len(df) for df in df_lst], [3, 2])
+            self.assertIn("value_3", df_lst[0].columns)
+
+    def test_native_output(self):
+        path_job = os.path.join(file_location, "calc_test_native", "job")
+        job = BashSciSweeper(
+            working_directory=path_job,
+            input_dict={"value_1": 1, "value_2": 2, "value_3": 3},
+            output_storage="native",
+            output_compression="gzip",
+        )
+        job.output_dict = {
+            "energy": 1.5,
+            "name": "test",
+            "forces": np.ones((100, 3)),
+            "result": [7, 1],
+        }
+        job.to_hdf()
+        with h5py.File(os.path.join(path_job, "scisweeper.h5"), "r") as f:
+            self.assertEqual(f["output_native"].attrs["energy"], 1.5)
+            self.assertEqual(f["output_native/forces"].compression, "gzip")
+            self.assertIsNotNone(f["output_native/forces"].chunks)
+        job_reload = SciSweeperJob(working_directory=path_job)
+        job_reload.from_hdf()
+        self.assertEqual(job_reload.output_storage, "native")
+        self.assertEqual(job_reload.output_compression, "gzip")
+        self.assertEqual(job_reload.output_dict["energy"], 1.5)
+        self.assertEqual(job_reload.output_dict["name"], "test")
+        self.assertEqual(job_reload.output_dict["result"], [7, 1])
+        self.assertTrue(
+            np.array_equal(job_reload.output_dict["forces"], np.ones((100, 3)))
+        )
+        with self.assertRaises(ValueError):
+            job.output_storage = "json"
+
+    def test_cache(self):
+        if os.name != "nt":
+            path_cache = os.path.join(file_location, "calc_test_cache", "cache")
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_cache", "a"),
+                cache=path_cache,
+            )
+            self.ssw.job_class = BashSciSweeper
+            input_dict_lst = [
+                {"value_1": 1, "value_2": 2, "value_3": 3},
+                {"value_1": 1, "value_2": 2, "value_3": 3},
+                {"value_1": 2, "value_2": 2, "value_3": 3},
+            ]
+            self.ssw.run_jobs_in_parallel(input_dict_lst=input_dict_lst)
+            self.assertFalse(
+                os.path.exists(
+                    os.path.join(self.ssw.working_directory, "job_1", "output.log")
+                )
+            )
+            self.ssw.collect()
+            self.assertEqual(len(self.ssw.results), 3)
+            self.assertEqual(len(self.ssw.broken_jobs), 0)
+            self.assertEqual(
+                len(set(tuple(r) for r in self.ssw.results.result.values)), 2
+            )
+            self.ssw.run_collect_output()
+            self.assertEqual(len(self.ssw.results), 3)
+            self.assertEqual(len(self.ssw.broken_jobs), 0)
+            job = BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_1"),
+                cache=path_cache,
+            )
+            job.run_broken_again()
+            self.assertEqual(job.output_dict["result"], [7, 1])
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_cache", "b"),
+                cache=path_cache,
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(input_dict_lst=input_dict_lst[::-1])
+            for job in os.listdir(self.ssw.working_directory):
+                self.assertFalse(
+                    os.path.exists(
+                        os.path.join(self.ssw.working_directory, job, "output.log")
+                    )
+                )
+            self.ssw.collect()
+            self.assertEqual(len(self.ssw.results), 3)
+
+    def test_cache_key(self):
+        path = os.path.join(file_location, "calc_test_cache_key")
+        array = np.arange(5000.0)
+        array_changed = array.copy()
+        array_changed[2500] = -1.0
+        key = SquareSciSweeper(
+            working_directory=path, input_dict={"x": array}
+        ).get_cache_key()
+        self.assertNotEqual(
+            key,
+            SquareSciSweeper(
+                working_directory=path, input_dict={"x": array_changed}
+            ).get_cache_key(),
+        )
+        self.assertNotEqual(
+            key,
+            SquareSciSweeper(
+                working_directory=path, input_dict={"x": array.astype(np.float32)}
+            ).get_cache_key(),
+        )
+        self.assertEqual(
+            key,
+            SquareSciSweeper(
+                working_directory=path, input_dict={"x": array.copy()}
+            ).get_cache_key(),
+        )
+        self.assertEqual(
+            SquareSciSweeper(
+                working_directory=path, input_dict={"x": 1}
+            ).get_cache_key(),
+            SquareSciSweeper(
+                working_directory=path, input_dict={"x": np.int64(1)}
+            ).get_cache_key(),
+        )
+
+    def test_run_generator(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_generator")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=grid(value_1=range(5), value_2=[2], value_3=[3]),
+                cores=2,
+                max_pending=1,
+            )
+            self.ssw.collect()
+            self.assertEqual(sorted(self.ssw.results.value_1.values), list(range(5)))
+
+    def test_run_adaptive(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_adaptive")
+            )
+            self.ssw.job_class = SquareSciSweeper
+            strategy = BisectionStrategy(
+                parameter="x",
+                lower=0.0,
+                upper=4.0,
+                output_key="y",
+                threshold=2.0,
+                tolerance=0.01,
+            )
+            result_lst = self.ssw.run_adaptive(strategy=strategy, budget=50, cores=2)
+            self.assertLess(len(result_lst), 50)
+            lower, upper = strategy.get_bracket(result_lst=result_lst)
+            self.assertLessEqual(upper - lower, 0.01)
+            self.assertTrue(lower <= 2 ** 0.5 <= upper)
+            job_number = len(os.listdir(self.ssw.working_directory))
+            strategy = BisectionStrategy(
+                parameter="x",
+                lower=0.0,
+                upper=4.0,
+                output_key="y",
+                threshold=3.0,
+                tolerance=0.01,
+            )
+            result_again_lst = self.ssw.run_adaptive(
+                strategy=strategy, budget=50, cores=2
+            )
+            for input_dict, output_dict in result_again_lst:
+                self.assertEqual(output_dict["y"], input_dict["x"] ** 2)
+            self.assertEqual(
+                len(os.listdir(self.ssw.working_directory)),
+                job_number + len(result_again_lst),
+            )
+            lower, upper = strategy.get_bracket(result_lst=result_again_lst)
+            self.assertTrue(lower <= 3 ** 0.5 <= upper)
+            result_lst = SciSweeper(
+                working_directory=os.path.join(
+                    file_location, "calc_test_adaptive", "refinement"
+                ),
+                job_class=SquareSciSweeper,
+            ).run_adaptive(
+                strategy=RefinementStrategy(
+                    parameter="x", lower=0.0, upper=4.0, output_key="y", tolerance=1.0
+                ),
+                budget=20,
+            )
+            x_lst = sorted([input_dict["x"] for input_dict, _ in result_lst])
+            self.assertEqual(len(result_lst), 20)
+            self.assertLess(x_lst[-1] - x_lst[-2], x_lst[1] - x_lst[0])
+
+    def test_manifest(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_manifest")
+            )
+            self.ssw.job_class = BashSciSweeper
+            input_dict_lst = [
+                {"value_1": i, "value_2": 2, "value_3": 3} for i in range(3)
+            ]
+            self.ssw.run_jobs_in_parallel(input_dict_lst=input_dict_lst)
+            manifest_file = os.path.join(
+                self.ssw.working_directory, "scisweeper_manifest.txt"
+            )
+            with open(manifest_file, "r") as f:
+                line_lst = f.readlines()
+            self.assertEqual(
+                sorted(l.split("\t")[:2] for l in line_lst),
+                [["finished", "job_0"], ["finished", "job_1"], ["finished", "job_2"]],
+            )
+            shutil.rmtree(os.path.join(self.ssw.working_directory, "job_0"))
+            shutil.rmtree(os.path.join(self.ssw.working_directory, "job_1"))
+            with open(manifest_file, "w") as f:
+                f.writelines([l for l in line_lst if "job_1" not in l])
+            self.ssw.run_jobs_in_parallel(input_dict_lst=input_dict_lst)
+            self.assertEqual(
+                sorted(
+                    f
+                    for f in os.listdir(self.ssw.working_directory)
+                    if f.startswith("job_")
+                ),
+                ["job_1", "job_2"],
+            )
+
+    def test_longest_first(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_longest_first")
+            )
+            self.ssw.job_class = BashSciSweeper
+            input_dict_lst = [
+                {"value_1": i, "value_2": 2, "value_3": 3} for i in range(3)
+            ]
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=input_dict_lst,
+                cores=1,
+                longest_first=True,
+                cost_function=lambda input_dict: input_dict["value_1"],
+            )
+            with open(
+                os.path.join(self.ssw.working_directory, "scisweeper_manifest.txt"),
+                "r",
+            ) as f:
+                job_name_lst = [l.split("\t")[1] for l in f.readlines()]
+            self.assertEqual(job_name_lst, ["job_2", "job_1", "job_0"])
+            job = SciSweeperJob(
+                working_directory=os.path.join(self.ssw.working_directory, "job_0")
+            )
+            job.from_hdf()
+            self.assertGreater(job.walltime, 0)
+
+    def test_max_pending(self):
+        if os.name != "nt":
+            input_dict_lst = [{"t": 1.0}] + [{"t": 0.01}] * 8
+            for d, backend in [
+                ("thread", "thread"),
+                ("executor", ThreadPoolExecutor(max_workers=2)),
+            ]:
+                self.ssw = SciSweeper(
+                    working_directory=os.path.join(
+                        file_location, "calc_test_max_pending", d
+                    )
+                )
+                self.ssw.job_class = SleepSciSweeper
+                self.ssw.run_jobs_in_parallel(
+                    input_dict_lst=input_dict_lst,
+                    cores=2,
+                    max_pending=1,
+                    backend=backend,
+                )
+                with open(
+                    os.path.join(self.ssw.working_directory, "scisweeper_manifest.txt"),
+                    "r",
+                ) as f:
+                    job_name_lst = [l.split("\t")[1] for l in f.readlines()]
+                self.assertEqual(len(job_name_lst), 9)
+                self.assertEqual(job_name_lst[-1], "job_0")
+
+    def test_timing(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_timing")
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(2)
+                ]
+            )
+            job = SciSweeperJob(
+                working_directory=os.path.join(self.ssw.working_directory, "job_0")
+            )
+            with mock.patch(
+                "scisweeper.scisweeper.read_timing", wraps=read_timing
+            ) as read_timing_mock:
+                job.from_hdf()
+                self.assertEqual(read_timing_mock.call_count, 0)
+                self.assertIn("executable_walltime", job.timing.keys())
+                self.assertIn("executable_walltime", job.timing.keys())
+                self.assertEqual(read_timing_mock.call_count, 1)
+            for phase in ["write_input", "executable", "collect_output", "to_hdf"]:
+                self.assertGreaterEqual(job.timing[phase + "_walltime"], 0)
+                self.assertIn(phase + "_cputime", job.timing.keys())
+            self.assertGreater(job.timing["executable_maxrss"], 0)
+            self.assertNotIn("write_input_maxrss", job.timing.keys())
+            self.ssw.collect(timing=True)
+            self.assertEqual(len(self.ssw.results), 2)
+            self.assertIn("executable_walltime", self.ssw.results.columns)
+            self.assertEqual(self.ssw.results.executable_walltime.isna().sum(), 0)
+            summary_df = self.ssw.get_timing_summary()
+            self.assertEqual(
+                list(summary_df.index),
+                ["write_input", "executable", "collect_output", "to_hdf"],
+            )
+            self.assertEqual(list(summary_df.jobs), [2, 2, 2, 2])
+            self.assertAlmostEqual(summary_df.fraction.sum(), 1.0)
+            memory = SciSweeper(
+                working_directory=os.path.join(
+                    file_location, "calc_test_timing", "memory"
+                ),
+                job_class=MemorySciSweeper,
+            )
+            memory.run_jobs_in_parallel(
+                input_dict_lst=[{"mb": 300}, {"mb": 1}], cores=1
+            )
+            maxrss_lst = []
+            for job_name in ["job_0", "job_1"]:
+                job = MemorySciSweeper(
+                    working_directory=os.path.join(memory.working_directory, job_name)
+                )
+                job.from_hdf()
+                maxrss_lst.append(job.timing["executable_maxrss"])
+            self.assertGreater(maxrss_lst[0], 300 * 1024)
+            self.assertLess(maxrss_lst[1], maxrss_lst[0] - 150 * 1024)
+
+    def test_events(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_events")
+            )
+            self.ssw.job_class = BashSciSweeper
+            event_lst = []
+            trace_file = os.path.join(self.ssw.working_directory, "trace.json")
+            sink = ChromeTraceSink(file_name=trace_file)
+            self.ssw.subscribe(
+                lambda event, job_name, timestamp: event_lst.append((job_name, event))
+            )
+            self.ssw.subscribe(sink)
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(3)
+                ],
+                cores=2,
+            )
+            sink.write()
+            self.assertEqual(
+                [event for job_name, event in event_lst if job_name == "job_1"],
+                [
+                    "queued",
+                    "started",
+                    "input_written",
+                    "executable_finished",
+                    "output_collected",
+                    "finished",
+                ],
+            )
+            with open(trace_file, "r") as f:
+                trace_event_lst = json.load(f)["traceEvents"]
+            self.assertEqual(
+                len([e for e in trace_event_lst if e.get("cat") == "job"]), 3
+            )
+            self.assertEqual(
+                len([e for e in trace_event_lst if e.get("cat") == "phase"]), 12
+            )
+            self.assertEqual(
+                [e["args"]["jobs"] for e in trace_event_lst if e["ph"] == "C"][-1], 0
+            )
+            event_lst.clear()
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(4)
+                ],
+                cores=2,
+            )
+            self.assertEqual(
+                [event for job_name, event in event_lst if job_name == "job_3"][0],
+                "queued",
+            )
+            self.assertEqual(
+                [event for job_name, event in event_lst if job_name == "job_3"][-1],
+                "finished",
+            )
+            sink = ChromeTraceSink(file_name=trace_file)
+            self.ssw.subscribe(sink)
+            for backend in ["thread", "process"]:
+                os.remove(
+                    os.path.join(self.ssw.working_directory, "scisweeper_manifest.txt")
+                )
+                self.ssw.run_jobs_in_parallel(
+                    input_dict_lst=[
+                        {"value_1": i, "value_2": 2, "value_3": 3} for i in range(4)
+                    ],
+                    cores=2,
+                    backend=backend,
+                )
+            self.assertEqual(
+                [
+                    e["args"]["jobs"]
+                    for e in sink.get_trace()["traceEvents"]
+                    if e["ph"] == "C"
+                ][-1],
+                0,
+            )
+            self.assertIn(("job_0", "skipped"), event_lst)
+            event_lst.clear()
+            job = BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_fail"),
+                input_dict={"value_1": 1},
+                event_callback=self.ssw._emit_event,
+            )
+            with self.assertRaises(KeyError):
+                job.run()
+            self.assertEqual(
+                event_lst, [("job_fail", "started"), ("job_fail", "failed")]
+            )
+
+    def test_failures(self):
+        if os.name != "nt":
+            input_dict_lst = [
+                {"value_1": i, "value_2": 2, "value_3": 3} for i in range(6)
+            ]
+            for backend in ["thread", "process", "asyncio"]:
+                self.ssw = SciSweeper(
+                    working_directory=os.path.join(
+                        file_location, "calc_test_failures", backend
+                    )
+                )
+                self.ssw.job_class = FailingSciSweeper
+                with self.assertWarns(UserWarning):
+                    self.ssw.run_jobs_in_parallel(
+                        input_dict_lst=input_dict_lst[:2],
+                        backend=backend,
+                        retries=1,
+                        retry_backoff=0.0,
+                    )
+                self.assertEqual(
+                    sorted(self.ssw.failed_jobs.keys()), ["job_0", "job_1"]
+                )
+                error_dict = self.ssw.failed_jobs["job_0"]
+                self.assertEqual(error_dict["returncode"], 3)
+                self.assertEqual(error_dict["stderr"], "failed\n")
+                self.assertEqual(error_dict["attempts"], 2)
+                self.assertIn("CalledProcessError", error_dict["exception"])
+                job = FailingSciSweeper(
+                    working_directory=os.path.join(self.ssw.working_directory, "job_0")
+                )
+                self.assertEqual(job.read_error()["returncode"], 3)
+            executor = ThreadPoolExecutor(max_workers=1)
+            for name, backend in [
+                ("thread", "thread"),
+                ("asyncio", "asyncio"),
+                ("executor", executor),
+            ]:
+                self.ssw = SciSweeper(
+                    working_directory=os.path.join(
+                        file_location, "calc_test_failures", "fail_fast_" + name
+                    )
+                )
+                self.ssw.job_class = FailingSciSweeper
+                with self.assertRaises(RuntimeError):
+                    self.ssw.run_jobs_in_parallel(
+                        input_dict_lst=input_dict_lst,
+                        cores=1,
+                        max_pending=1,
+                        fail_fast=1.0,
+                        fail_fast_window=2,
+                        backend=backend,
+                    )
+                self.assertGreaterEqual(len(self.ssw.failed_jobs), 2)
+                self.assertLess(len(self.ssw.failed_jobs), 6)
+            executor.shutdown()
+
+    def test_runtime_model(self):
+        model = RuntimeModel()
+        self.assertEqual(model.predict({"n": 1}), 0.0)
+        model.fit(
+            input_dict_lst=[{"n": n, "name": "a", "flag": True} for n in range(1, 5)],
+            walltime_lst=[2.0 * n + 1.0 for n in range(1, 5)],
+        )
+        self.assertAlmostEqual(model.predict({"n": 10, "name": "b"}), 21.0)
+        self.assertAlmostEqual(model.predict({"n": -10}), 3.0)
+        self.assertAlmostEqual(model.predict({"n": "x"}), 6.0)
+
+    def test_collect_columns(self):
+        if os.name != "nt":
+            self.ssw = SciSweeper(
+                working_directory=os.path.join(file_location, "calc_test_columns"),
+                output_storage="native",
+            )
+            self.ssw.job_class = BashSciSweeper
+            self.ssw.run_jobs_in_parallel(
+                input_dict_lst=[
+                    {"value_1": i, "value_2": 2, "value_3": 3} for i in range(2)
+                ]
+            )
+            job = BashSciSweeper(
+                working_directory=os.path.join(self.ssw.working_directory, "job_2"),
+                input_dict={"value_1": 2, "value_2": 2, "value_3": 3},
+                output_storage="native",
+            )
+            job.output_dict = {"energy": np.arange(3)}
+            job.to_hdf()
+            self.ssw.collect(columns=["value_1", "result"])
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(list(df.columns), ["dir", "value_1", "result"])
+            self.assertEqual(list(df.value_1.values), [0, 1, 2])
+            self.assertEqual(
+                self.ssw.broken_jobs,
+                [os.path.join(self.ssw.working_directory, "job_2")],
+            )
+            self.ssw.collect(output_columns=["energy"])
+            df = self.ssw.results.sort_values("dir")
+            self.assertEqual(
+                list(df.columns), ["dir", "value_1", "value_2", "value_3", "energy"]
+            )
+            self.assertEqual(list(df.energy.values[2]), [0, 1, 2])
+            self.assertEqual(len(self.ssw.broken_jobs), 2)
+            with self.assertRaises(ValueError):
+                self.ssw.collect(incremental=True, columns=["value_1"])
+            file_name = os.path.join(
+                self.ssw.working_directory, "job_0", "scisweeper.h5"
+            )
+            input_dict, output_dict = read_keys(
+                file_name=file_name,
+                input_key_lst=["value_1"],
+                output_key_lst=["result"],
+            )
+            self.assertEqual(input_dict, {"value_1": 0})
+            self.assertEqual(output_dict, {"result": [6, 1]})
+            with mock.patch("scisweeper.hdf._get_triage_read", return_value=None):
+                self.assertEqual(
+                    read_keys(
+                        file_name=file_name,
+                        input_key_lst=["value_1"],
+                        output_key_lst=["result"],
+                    ),
+                    (input_dict, output_dict),
+                )
+
+    def test_assemble_results_compact(self):
+        job_lst = [
+            (
+                "job_" + str(i),
+                {"a": i, "label": "x"},
+                {"x": float(i), "y": [i, 1]},
+            )
+            for i in range(20)
+        ]
+        job_lst[0][2]["rare"] = 1.0
+        df, broken_jobs = SciSweeper._assemble_results(job_lst=job_lst, compact=True)
+        self.assertEqual(df.a.dtype, np.int64)
+        self.assertEqual(df.x.dtype, np.float64)
+        self.assertEqual(df.label.dtype.name, "category")
+        self.assertIsInstance(df.rare.dtype, pandas.SparseDtype)
+        self.assertEqual(list(df.y.values[3]), [3, 1])
+        self.assertIs(df.y.values[3].base, df.y.values[4].base)
+        self.assertEqual(len(broken_jobs), 19)
+
     def test_properties(self):
         self.ssw = SciSweeper(
             working_directory=os.path.join(file_location, "calc_test_property")